@@ -0,0 +1,71 @@
+"""Store refresh tokens as SHA-256 digests
+
+Existing tokens are hashed in place, so signed-in users stay signed in.
+Databases created from the current models already have the new column
+and are left untouched.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TOKEN_HASH = sa.LargeBinary(32).with_variant(mysql.BINARY(32), "mysql")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "refresh_token_hash" in {column["name"] for column in inspector.get_columns("tokens")}:
+        return
+
+    op.add_column("tokens", sa.Column("refresh_token_hash", TOKEN_HASH, nullable=True))
+
+    tokens = sa.table(
+        "tokens",
+        sa.column("id", sa.Integer),
+        sa.column("refresh_token", sa.String),
+        sa.column("refresh_token_hash", TOKEN_HASH),
+    )
+    hashes = [
+        {"token_id": token_id, "digest": hashlib.sha256(refresh_token.encode()).digest()}
+        for token_id, refresh_token in bind.execute(sa.select(tokens.c.id, tokens.c.refresh_token))
+    ]
+    if hashes:
+        bind.execute(
+            tokens.update()
+            .where(tokens.c.id == sa.bindparam("token_id"))
+            .values(refresh_token_hash=sa.bindparam("digest")),
+            hashes,
+        )
+
+    old_indexes = {index["name"] for index in inspector.get_indexes("tokens")}
+    with op.batch_alter_table("tokens") as batch_op:
+        batch_op.alter_column("refresh_token_hash", existing_type=TOKEN_HASH, nullable=False)
+        if "ix_tokens_refresh_token" in old_indexes:
+            batch_op.drop_index("ix_tokens_refresh_token")
+        batch_op.drop_column("refresh_token")
+        batch_op.create_index("ix_tokens_refresh_token_hash", ["refresh_token_hash"], unique=True)
+
+
+def downgrade() -> None:
+    # Digests can't be turned back into tokens; revoke them all instead
+    op.execute(sa.text("DELETE FROM tokens"))
+    with op.batch_alter_table("tokens") as batch_op:
+        batch_op.drop_index("ix_tokens_refresh_token_hash")
+        batch_op.drop_column("refresh_token_hash")
+        batch_op.add_column(sa.Column("refresh_token", sa.String(255), nullable=False))
+        batch_op.create_index("ix_tokens_refresh_token", ["refresh_token"], unique=True)
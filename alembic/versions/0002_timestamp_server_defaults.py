@@ -0,0 +1,64 @@
+"""Let the database stamp the created/updated timestamp columns
+
+The models rely on server-side defaults for these columns. Tables created
+before that change have none, so inserts left them NULL. Add the defaults
+and fill in any rows written in the meantime.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = {
+    "tournaments": ("created_at", "updated_at"),
+    "seasons": ("created_at", "updated_at"),
+    "players": ("created_at", "updated_at"),
+    "player_seasons": ("registered_at", "created_at", "updated_at"),
+    "teams": ("created_at", "updated_at"),
+    "team_seasons": ("created_at",),
+    "player_purchases": ("purchased_at",),
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        existing = {column["name"]: column for column in inspector.get_columns(table)}
+        missing = [name for name in columns if existing[name]["default"] is None]
+        if not missing:
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for name in missing:
+                batch_op.alter_column(
+                    name,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=True,
+                    server_default=sa.text("CURRENT_TIMESTAMP"),
+                )
+        for name in missing:
+            op.execute(sa.text(f"UPDATE {table} SET {name} = CURRENT_TIMESTAMP WHERE {name} IS NULL"))
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for name in columns:
+                batch_op.alter_column(
+                    name,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=True,
+                    server_default=None,
+                )
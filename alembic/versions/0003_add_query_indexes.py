@@ -0,0 +1,42 @@
+"""Add the indexes behind the auction, listing and cleanup queries
+
+Covers the indexes declared in the models' __table_args__ after their
+tables were first created; any that already exist are skipped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = (
+    ("ix_token_expires_at", "tokens", ["expires_at"]),
+    ("ix_player_seasons_season_status_round", "player_seasons", ["season_id", "auction_status", "auction_round"]),
+    ("ix_team_seasons_season_icon_player", "team_seasons", ["season_id", "icon_player_id"]),
+    ("ix_users_is_approved_role", "users", ["is_approved", "role"]),
+    ("ix_team_seasons_season_active", "team_seasons", ["season_id", "is_active"]),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -1,16 +1,50 @@
+import time
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session, defer, make_transient_to_detached
 
-from app.core import settings
+from app.core import security
 from app.models import User
 from app.enums import Role
 from app.db.session import SessionLocal
+from app.utils.cache import TTLCache
 
 # This points to your login URL. FastAPI uses this for documentation.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Decoded access-token payloads keyed by SHA-256(token), so back-to-back
+# requests with the same token skip the signature check
+_token_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# Serialized profile responses keyed by user id for polled endpoints, each
+# stored with the field values it was encoded from. A hit only counts when
+# the freshly loaded user still has those values, so a change made through
+# another worker shows up at once.
+user_profile_cache = TTLCache(maxsize=10_000, ttl=10)
+
+# Column values of recently authenticated users keyed by user id, so polling
+# clients skip the user SELECT. Endpoints that modify a user must call
+# invalidate_user.
+_user_snapshot_cache = TTLCache(maxsize=10_000, ttl=30)
+_USER_SNAPSHOT_COLUMNS = tuple(
+    attr.key for attr in inspect(User).column_attrs if attr.key != "hashed_password"
+)
+
+def invalidate_user(user_id: int) -> None:
+    """Drop every cached view of a user after it has been modified."""
+    _user_snapshot_cache.pop(user_id)
+    user_profile_cache.pop(user_id)
+
+def _user_from_snapshot(db: Session, snapshot: dict) -> User:
+    """Attach a cached user to this session without querying the database."""
+    user = User(**snapshot)
+    # Mark the values as loaded rather than pending; the password hash is
+    # left unloaded and still fetched on access if anything needs it
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -18,16 +52,17 @@ def get_db():
     finally:
         db.close()
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+def _decode_access_token(token: str) -> dict:
+    """Verify an access token, reusing a recent decode of the same token."""
+    cache_key = security.hash_token(token)
+    payload = _token_cache.get(cache_key)
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+        if payload is None:
+            payload = security.decode_token(token)
+            # Never keep a payload around past the token's own expiry
+            if "exp" in payload:
+                _token_cache.set(cache_key, payload, ttl=min(_token_cache.ttl, payload["exp"] - time.time()))
+        if payload.get("sub") is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token",
@@ -39,19 +74,69 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    
-    user = db.query(User).filter(User.email == username).first()
+    return payload
+
+def _load_user(db: Session, payload: dict, use_snapshot: bool) -> User:
+    """Load the token's user, optionally from this worker's recent snapshot."""
+    # The password hash is never needed to authorize a request
+    user_id = payload.get("uid")
+    if user_id is not None:
+        if use_snapshot:
+            snapshot = _user_snapshot_cache.get(user_id)
+            if snapshot is not None:
+                return _user_from_snapshot(db, snapshot)
+        # Primary-key fetch; served from the identity map if already loaded
+        user = db.get(User, user_id, options=[defer(User.hashed_password)])
+        if user is not None:
+            _user_snapshot_cache.set(user_id, {key: getattr(user, key) for key in _USER_SNAPSHOT_COLUMNS})
+    else:
+        # Tokens issued before the uid claim existed only carry the email
+        user = db.execute(
+            select(User).options(defer(User.hashed_password)).where(User.email == payload["sub"])
+        ).scalar_one_or_none()
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
-def get_current_superadmin(current_user: User = Depends(get_current_user)) -> User:
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """
+    The requesting user, possibly from a snapshot up to 30 seconds old. Each
+    worker keeps its own snapshots, so don't authorize on or return role,
+    approval or credits with this; use get_current_user_fresh or the role
+    dependencies below.
+    """
+    return _load_user(db, _decode_access_token(token), use_snapshot=True)
+
+def get_current_user_fresh(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """The requesting user as currently stored, so role and approval changes apply at once on every worker."""
+    return _load_user(db, _decode_access_token(token), use_snapshot=False)
+
+def get_authenticated_user(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+) -> User:
+    """
+    Authenticate the request, then close its session so the pooled connection
+    goes back before the handler makes slow external calls (e.g. S3). Only for
+    endpoints that do not query the database themselves.
+    """
+    db.close()
+    return current_user
+
+# The role checks below only read attributes of the already-loaded user, so
+# they run on the event loop rather than taking another worker-thread hop.
+# They always read the stored row: a cached snapshot could let a demoted or
+# rejected user through on workers that did not see the change.
+async def get_current_superadmin(current_user: User = Depends(get_current_user_fresh)) -> User:
     if current_user.role != Role.SUPERADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -59,7 +144,7 @@ def get_current_superadmin(current_user: User = Depends(get_current_user)) -> Us
         )
     return current_user
 
-def get_current_organizer(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_organizer(current_user: User = Depends(get_current_user_fresh)) -> User:
     if current_user.role not in [Role.ORGANIZER, Role.SUPERADMIN]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,64 +1,61 @@
-from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, joinedload
 
+from app.api import deps
 from app.dto import UserCreate, User, Token, RefreshTokenRequest
 from app.dto.auth_dto import EmailSchema, ResetPasswordSchema, TokenSchema  
 from app.models import User as UserModel, Token as TokenModel
-from app.core import security, settings
-from app.db import SessionLocal
+from app.core import security
 from app.enums import Role
 from app.utils.email_helper import send_verification_email, send_password_reset_email
 
-router = APIRouter()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/signup", response_model=User, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     *,
-    db: Session = Depends(get_db),
+    db: Session = Depends(deps.get_db),
     user_in: UserCreate,
     background_tasks: BackgroundTasks
 ):
     """
     Create a new user and send a verification email in the background.
+    Runs in the threadpool: the uniqueness query, the password hash and the
+    commit all block.
     """
-    user = db.query(UserModel).filter(UserModel.email == user_in.email).first()
-    if user:
-        raise HTTPException(
-            status_code=400,
-            detail="The user with this email already exists.",
-        )
-    
+    # Check email and mobile uniqueness in a single round trip
+    conflict_filter = UserModel.email == user_in.email
     if user_in.mobile:
-        user = db.query(UserModel).filter(UserModel.mobile == user_in.mobile).first()
-        if user:
+        conflict_filter = or_(conflict_filter, UserModel.mobile == user_in.mobile)
+    # At most two rows can match; prefer the email match for the error message
+    user = db.scalars(
+        select(UserModel).where(conflict_filter).order_by((UserModel.email == user_in.email).desc())
+    ).first()
+    if user:
+        if user.email == user_in.email:
             raise HTTPException(
                 status_code=400,
-                detail="The user with this mobile number already exists.",
+                detail="The user with this email already exists.",
             )
+        raise HTTPException(
+            status_code=400,
+            detail="The user with this mobile number already exists.",
+        )
 
-    hashed_password = security.get_password_hash(user_in.password)
-    
     db_user = UserModel(
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         email=user_in.email,
         mobile=user_in.mobile,
-        hashed_password=hashed_password,
+        hashed_password=security.get_password_hash(user_in.password),
     )
     
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     
     # Generate a token and send the verification email
     token = security.create_access_token(data={"sub": db_user.email, "scope": "email_verification"})
@@ -68,7 +65,7 @@ async def create_user(
 
 
 @router.post("/verify-email")
-def verify_email(request: TokenSchema, db: Session = Depends(get_db)):
+def verify_email(request: TokenSchema, db: Session = Depends(deps.get_db)):
     """
     Verify a user's email address from a token sent in the request body.
     """
@@ -78,7 +75,7 @@ def verify_email(request: TokenSchema, db: Session = Depends(get_db)):
     )
     try:
         # Read the token from the request body via the TokenSchema
-        payload = security.jwt.decode(request.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = security.decode_token(request.token)
         if payload.get("scope") != "email_verification":
             raise credentials_exception
         email: str = payload.get("sub")
@@ -86,10 +83,10 @@ def verify_email(request: TokenSchema, db: Session = Depends(get_db)):
             raise credentials_exception
     except security.jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Verification link has expired. Please request a new one.")
-    except security.jwt.JWTError:
+    except security.jwt.InvalidTokenError:
         raise credentials_exception
 
-    user = db.query(UserModel).filter(UserModel.email == email).first()
+    user = db.execute(select(UserModel).where(UserModel.email == email)).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
@@ -98,20 +95,21 @@ def verify_email(request: TokenSchema, db: Session = Depends(get_db)):
     
     user.is_verified = True
     db.commit()
+    deps.invalidate_user(user.id)
     
     return {"message": "Email verified successfully! You can now log in."}
 
 
 @router.post("/resend-verification")
-async def resend_verification_email(
+def resend_verification_email(
     request: EmailSchema,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: Session = Depends(deps.get_db)
 ):
     """
     Resend the verification email to a user who has not yet verified their account.
     """
-    user = db.query(UserModel).filter(UserModel.email == request.email).first()
+    user = db.execute(select(UserModel).where(UserModel.email == request.email)).scalar_one_or_none()
     if user and not user.is_verified:
         token = security.create_access_token(data={"sub": user.email, "scope": "email_verification"})
         background_tasks.add_task(send_verification_email, email=user.email, token=token)
@@ -121,21 +119,32 @@ async def resend_verification_email(
 
 @router.post("/login", response_model=Token)
 def login_for_access_token(
-    db: Session = Depends(get_db),
+    db: Session = Depends(deps.get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
     Handles user login, returns access/refresh tokens, and requires email verification.
     """
-    user = db.query(UserModel).filter(UserModel.email == form_data.username).first()
+    user = db.execute(select(UserModel).where(UserModel.email == form_data.username)).scalar_one_or_none()
+
+    if user:
+        is_valid, new_hash = security.verify_and_update_password(form_data.password, user.hashed_password)
+    else:
+        # Hash anyway so a missing account takes as long as a wrong password
+        security.dummy_verify()
+        is_valid, new_hash = False, None
 
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    # Transparently upgrade legacy bcrypt hashes to argon2
+    if new_hash:
+        user.hashed_password = new_hash
+
     if not user.is_verified:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -153,32 +162,34 @@ def login_for_access_token(
             detail="Your account has been rejected. Please contact the administrator.",
         )
 
-    access_token = security.create_access_token(data={"sub": user.email})
+    access_token = security.create_access_token(data={"sub": user.email, "uid": user.id})
     refresh_token = security.create_refresh_token(data={"sub": user.email})
-    expires_at = datetime.now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = security.utcnow() + security.REFRESH_TOKEN_LIFETIME
 
-    db_token = TokenModel(
+    # The user lookup, any hash upgrade and the token insert share one
+    # transaction; nothing is read back from the new row, so skip the refresh.
+    db.add(TokenModel(
         user_id=user.id,
-        refresh_token=refresh_token,
+        refresh_token_hash=security.hash_token(refresh_token),
         expires_at=expires_at
-    )
-    db.add(db_token)
+    ))
     db.commit()
-    db.refresh(db_token)
 
-    return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
+    # Token payloads are plain strings; return them directly instead of
+    # running them back through the Token model
+    return ORJSONResponse({"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"})
 
 
 @router.post("/forgot-password")
-async def forgot_password(
+def forgot_password(
     request: EmailSchema,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: Session = Depends(deps.get_db)
 ):
     """
     Sends a password reset link to the user's email if the user exists.
     """
-    user = db.query(UserModel).filter(UserModel.email == request.email).first()
+    user = db.execute(select(UserModel).where(UserModel.email == request.email)).scalar_one_or_none()
     if user:
         reset_token = security.create_access_token(data={"sub": user.email, "scope": "password_reset"})
         background_tasks.add_task(send_password_reset_email, email=user.email, token=reset_token)
@@ -187,7 +198,7 @@ async def forgot_password(
 
 
 @router.post("/reset-password")
-def reset_password(request: ResetPasswordSchema, db: Session = Depends(get_db)):
+def reset_password(request: ResetPasswordSchema, db: Session = Depends(deps.get_db)):
     """
     Resets the user's password using the token from the reset link.
     """
@@ -196,7 +207,7 @@ def reset_password(request: ResetPasswordSchema, db: Session = Depends(get_db)):
         detail="Invalid token",
     )
     try:
-        payload = security.jwt.decode(request.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = security.decode_token(request.token)
         if payload.get("scope") != "password_reset":
             raise credentials_exception
         email: str = payload.get("sub")
@@ -204,10 +215,10 @@ def reset_password(request: ResetPasswordSchema, db: Session = Depends(get_db)):
             raise credentials_exception
     except security.jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Password reset link has expired.")
-    except security.jwt.JWTError:
+    except security.jwt.InvalidTokenError:
         raise credentials_exception
 
-    user = db.query(UserModel).filter(UserModel.email == email).first()
+    user = db.execute(select(UserModel).where(UserModel.email == email)).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         
@@ -220,14 +231,32 @@ def reset_password(request: ResetPasswordSchema, db: Session = Depends(get_db)):
 @router.post("/refresh", response_model=Token)
 def refresh_access_token(
     refresh_request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(deps.get_db)
 ):
     """
     Refresh access token using a valid refresh token.
     """
-    db_token = db.query(TokenModel).filter(
-        TokenModel.refresh_token == refresh_request.refresh_token
-    ).first()
+    # Reject forged or expired tokens from the signature alone; the database
+    # is only needed to check revocation and rotate the token.
+    try:
+        security.decode_token(refresh_request.refresh_token)
+    except security.jwt.ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has expired"
+        )
+    except security.jwt.InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+        )
+
+    # Fetch the owner in the same query; only its email goes into new tokens
+    db_token = db.execute(
+        select(TokenModel)
+        .options(joinedload(TokenModel.user).load_only(UserModel.id, UserModel.email))
+        .where(TokenModel.refresh_token_hash == security.hash_token(refresh_request.refresh_token))
+    ).scalar_one_or_none()
     
     if not db_token:
         raise HTTPException(
@@ -235,7 +264,7 @@ def refresh_access_token(
             detail="Invalid refresh token"
         )
     
-    if db_token.expires_at < datetime.now():
+    if db_token.expires_at < security.utcnow():
         db.delete(db_token)
         db.commit()
         raise HTTPException(
@@ -250,13 +279,12 @@ def refresh_access_token(
             detail="User not found"
         )
     
-    new_access_token = security.create_access_token(data={"sub": user.email})
+    new_access_token = security.create_access_token(data={"sub": user.email, "uid": user.id})
     new_refresh_token = security.create_refresh_token(data={"sub": user.email})
-    new_expires_at = datetime.now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    new_expires_at = security.utcnow() + security.REFRESH_TOKEN_LIFETIME
     
-    db_token.refresh_token = new_refresh_token
+    db_token.refresh_token_hash = security.hash_token(new_refresh_token)
     db_token.expires_at = new_expires_at
     db.commit()
-    db.refresh(db_token)
     
-    return {"access_token": new_access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
+    return ORJSONResponse({"access_token": new_access_token, "refresh_token": new_refresh_token, "token_type": "bearer"})
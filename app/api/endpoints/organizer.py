@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Union
 from app.api import deps
 from app.models import User
 from app.dto.user_dto import User as UserSchema
@@ -13,106 +16,160 @@ from app.dto.team_dto import (
 )
 from app.dto.auction_dto import (
     AuctionStart, PlayerBid, ManualPlayerSelect, FastAssignment,
-    AuctionPlayerResponse, TeamOverview, TeamDetails, AuctionPlayersList
+    AuctionPlayerResponse, AuctionActionRequired, TeamOverview, TeamDetails, AuctionPlayersList, SeasonSummary
 )
 from app.services import (
     TournamentService, PlayerService, TeamService, AuctionService, TrackingService
 )
+from app.utils.serializers import construct_from_orm
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared dependency markers for every route in this router
+DB = Depends(deps.get_db)
+ORGANIZER = Depends(deps.get_current_organizer)
+CURRENT_USER_FRESH = Depends(deps.get_current_user_fresh)
+
+# Serializers for the large list responses, built once at import.
+# Read-only lists that come back as plain rows skip these and go straight to
+# orjson; every handler still declares response_model for the OpenAPI schema.
+_TEAM_OVERVIEW_LIST = TypeAdapter(List[TeamOverview])
+_SEASON_SUMMARY = TypeAdapter(SeasonSummary)
+_USER = TypeAdapter(UserSchema)
+_USER_FIELDS = tuple(UserSchema.model_fields)
+
+
+def _json_list(adapter: TypeAdapter, models: list) -> Response:
+    """Encodes DTOs the service already built straight to JSON bytes, without validating them again."""
+    return Response(content=adapter.dump_json(models), media_type="application/json")
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Encodes a DTO the service already validated, skipping FastAPI's second response_model pass."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _profile_response(user: User) -> Response:
+    """Returns the user's serialized profile, reusing a recent encoding of the same values."""
+    values = tuple(getattr(user, name) for name in _USER_FIELDS)
+    cached = deps.user_profile_cache.get(user.id)
+    if cached is not None and cached[0] == values:
+        content = cached[1]
+    else:
+        content = _USER.dump_json(_USER.validate_python(user, from_attributes=True))
+        deps.user_profile_cache.set(user.id, (values, content))
+    return Response(content=content, media_type="application/json")
+
+
+def _stream_rows(rows) -> StreamingResponse:
+    """Streams Core result mappings as a JSON array without going through pydantic."""
+    def encode():
+        yield b"["
+        for index, row in enumerate(rows):
+            if index:
+                yield b","
+            yield orjson.dumps(dict(row))
+        yield b"]"
+    # The request's DB session stays open until the response finishes, so
+    # rows can keep loading while earlier ones are already on the wire.
+    return StreamingResponse(encode(), media_type="application/json")
 
 # Dashboard and Profile endpoints
+# These only return the already-loaded user, so run them on the event loop
+# instead of borrowing a worker thread.
 @router.get("/dashboard", response_model=UserSchema, tags=["Tournament Management"])
-def read_user_dashboard(current_user: User = Depends(deps.get_current_user)):
+async def read_user_dashboard(current_user: User = CURRENT_USER_FRESH):
     """
     Get the current logged-in user's dashboard info.
     """
-    return current_user
+    return _profile_response(current_user)
 
 @router.get("/profile", response_model=UserSchema, tags=["Tournament Management"])
-def get_organizer_profile(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+async def get_organizer_profile(
+    current_user: User = ORGANIZER
 ):
     """
     Get the current organizer's profile.
     """
-    return current_user
+    return _profile_response(current_user)
 
 
 # Tournament Management
 @router.post("/tournaments", response_model=TournamentResponse, tags=["Tournament Management"])
 def create_tournament(
     tournament_data: TournamentCreate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Create a new tournament. No credit limit - organizers can create unlimited tournaments.
     """
-    return TournamentService.create_tournament(tournament_data, current_user, db)
+    return _model_response(TournamentService.create_tournament(tournament_data, current_user, db))
 
 @router.post("/tournaments/{tournament_id}/seasons", response_model=Season, tags=["Tournament Management"])
 def create_season(
     tournament_id: int,
     season_data: SeasonCreate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Create a new season under an existing tournament. Uses 1 auction credit.
     """
-    return TournamentService.create_season(tournament_id, season_data, current_user, db)
+    season = TournamentService.create_season(tournament_id, season_data, current_user, db)
+    # The profile reports auctions_created, which this just incremented
+    deps.invalidate_user(current_user.id)
+    return season
 
 @router.get("/tournaments/{tournament_id}/seasons", response_model=List[Season], tags=["Tournament Management"])
 def get_tournament_seasons(
     tournament_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get all seasons for a specific tournament.
     """
-    return TournamentService.get_tournament_seasons(tournament_id, current_user, db)
+    return ORJSONResponse(TournamentService.get_tournament_seasons(tournament_id, current_user, db))
 
 @router.get("/seasons", response_model=List[Season], tags=["Tournament Management"])
 def get_my_seasons(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get all seasons created by the current organizer.
     """
-    return TournamentService.get_my_seasons(current_user, db)
+    return ORJSONResponse(TournamentService.get_my_seasons(current_user, db))
 
 @router.get("/tournaments", response_model=List[TournamentResponse], tags=["Tournament Management"])
 def get_my_tournaments(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get all tournaments created by the current organizer.
     """
-    return TournamentService.get_my_tournaments(current_user, db)
+    return ORJSONResponse(TournamentService.get_my_tournaments(current_user, db))
 
 # Player Management
 @router.get("/players/search/{mobile}", response_model=Player, tags=["Player Management"])
 def get_player_by_mobile(
     mobile: str,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Search for existing player data by mobile number for auto-fill functionality.
     """
-    return PlayerService.get_player_by_mobile(mobile, db)
+    return _model_response(construct_from_orm(Player, PlayerService.get_player_by_mobile(mobile, db)))
 
 @router.post("/seasons/{season_id}/players", response_model=PlayerSeason, tags=["Player Management"])
 def register_player(
     season_id: int,
     player_data: PlayerCreate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Register a player for a season.
@@ -122,19 +179,19 @@ def register_player(
 @router.get("/seasons/{season_id}/players", response_model=List[PlayerSeason], tags=["Player Management"])
 def get_season_players(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get all players registered for a season.
     """
-    return PlayerService.get_season_players(season_id, current_user, db)
+    return _stream_rows(PlayerService.get_season_players(season_id, current_user, db))
 
 @router.post("/seasons/{season_id}/close-registration", tags=["Player Management"])
 def close_player_registration(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Close player registration for a season.
@@ -145,8 +202,8 @@ def close_player_registration(
 def select_players_for_auction(
     season_id: int,
     selection_data: PlayerSelectionUpdate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Select players for auction from registered players.
@@ -158,31 +215,31 @@ def select_players_for_auction(
 def configure_auction(
     season_id: int,
     config_data: AuctionConfigCreate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Configure auction settings for a season.
     """
-    return TeamService.configure_auction(season_id, config_data, current_user, db)
+    return _model_response(TeamService.configure_auction(season_id, config_data, current_user, db))
 
 @router.get("/seasons/{season_id}/auction-config", response_model=AuctionConfig, tags=["Team Management"])
 def get_auction_config(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get auction configuration for a season.
     """
-    return TeamService.get_auction_config(season_id, current_user, db)
+    return _model_response(TeamService.get_auction_config(season_id, current_user, db))
 
 @router.post("/seasons/{season_id}/teams", response_model=List[TeamSeason], tags=["Team Management"])
 def register_teams_for_season(
     season_id: int,
     team_data: TeamRegistrationCreate,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Register multiple teams for a season.
@@ -192,20 +249,20 @@ def register_teams_for_season(
 @router.get("/seasons/{season_id}/teams", response_model=List[TeamSeason], tags=["Team Management"])
 def get_season_teams(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get all teams registered for a season.
     """
-    return TeamService.get_season_teams(season_id, current_user, db)
+    return ORJSONResponse(TeamService.get_season_teams(season_id, current_user, db))
 
 @router.post("/seasons/{season_id}/assign-icon-players", tags=["Team Management"])
 def assign_icon_players(
     season_id: int,
     assignments: List[TeamWithIconPlayer],
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Assign icon players to teams.
@@ -217,43 +274,45 @@ def assign_icon_players(
 def start_auction(
     season_id: int,
     auction_config: AuctionStart,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Start the auction for a season.
     """
     return AuctionService.start_auction(season_id, auction_config, current_user, db)
 
-@router.get("/seasons/{season_id}/next-player", response_model=AuctionPlayerResponse, tags=["Auction System"])
+@router.get("/seasons/{season_id}/next-player", response_model=Union[AuctionPlayerResponse, AuctionActionRequired], tags=["Auction System"])
 def get_next_auction_player(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get next random player for auction (RANDOM mode).
+    When the round has no pending players left, says whether to start the
+    next round or that the auction is complete.
     """
-    return AuctionService.get_next_auction_player(season_id, current_user, db)
+    return _model_response(AuctionService.get_next_auction_player(season_id, current_user, db))
 
 @router.post("/seasons/{season_id}/manual-player", tags=["Auction System"])
 def get_manual_auction_player(
     season_id: int,
     player_select: ManualPlayerSelect,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get specific player for auction (MANUAL mode).
     """
-    return AuctionService.get_manual_auction_player(season_id, player_select, current_user, db)
+    return _model_response(AuctionService.get_manual_auction_player(season_id, player_select, current_user, db))
 
 @router.post("/seasons/{season_id}/bid-player", tags=["Auction System"])
 def bid_on_player(
     season_id: int,
     bid_data: PlayerBid,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Process player bid - either sell to team or mark as unsold.
@@ -264,8 +323,8 @@ def bid_on_player(
 def fast_assign_players(
     season_id: int,
     assignments: List[FastAssignment],
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Fast assign multiple players to teams without bidding process.
@@ -275,8 +334,8 @@ def fast_assign_players(
 @router.post("/seasons/{season_id}/start-next-round", tags=["Auction System"])
 def start_next_auction_round(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Start next auction round with unsold players.
@@ -287,33 +346,45 @@ def start_next_auction_round(
 @router.get("/seasons/{season_id}/teams-overview", response_model=List[TeamOverview], tags=["Team Tracking"])
 def get_teams_overview(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get overview of all teams in season.
     """
-    return TrackingService.get_teams_overview(season_id, current_user, db)
+    return _json_list(_TEAM_OVERVIEW_LIST, TrackingService.get_teams_overview(season_id, current_user, db))
 
 @router.get("/seasons/{season_id}/teams/{team_id}/details", response_model=TeamDetails, tags=["Team Tracking"])
 def get_team_details(
     season_id: int,
     team_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get detailed view of a specific team.
     """
-    return TrackingService.get_team_details(season_id, team_id, current_user, db)
+    return _model_response(TrackingService.get_team_details(season_id, team_id, current_user, db))
 
 @router.get("/seasons/{season_id}/auction-players", response_model=List[AuctionPlayersList], tags=["Team Tracking"])
 def get_auction_players_list(
     season_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_organizer)
+    db: Session = DB,
+    current_user: User = ORGANIZER
 ):
     """
     Get list of all players selected for auction.
     """
-    return TrackingService.get_auction_players_list(season_id, current_user, db)
+    return _stream_rows(TrackingService.get_auction_players_list(season_id, current_user, db))
+
+@router.get("/seasons/{season_id}/summary", response_model=SeasonSummary, tags=["Team Tracking"])
+def get_season_summary(
+    season_id: int,
+    db: Session = DB,
+    current_user: User = ORGANIZER
+):
+    """
+    Get the teams overview and the auction players list in one response.
+    """
+    summary = TrackingService.get_season_summary(season_id, current_user, db)
+    return Response(content=_SEASON_SUMMARY.dump_json(summary), media_type="application/json")
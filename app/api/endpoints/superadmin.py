@@ -1,12 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List
 from app.api import deps
 from app.models import User
 from app.enums import Role
-from app.dto.user_dto import User as UserSchema, UserLimitUpdate, UserRoleUpdate, UserApprovalUpdate
+from app.dto.user_dto import (
+    User as UserSchema, UserLimitUpdate, UserRoleUpdate, UserApprovalUpdate, UserBulkApprovalUpdate,
+    UserBulkUpdateItem
+)
+from app.utils.serializers import construct_from_orm
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Users come from stored rows, so lists are constructed rather than validated
+_USER_LIST = TypeAdapter(List[UserSchema])
+
+# Approval status accepted by the listing endpoint -> matching filter
+_APPROVAL_STATUS_FILTERS = {
+    "pending": User.is_approved.is_(None),
+    "approved": User.is_approved == True,
+    "rejected": User.is_approved == False,
+}
 
 @router.post("/users/{user_id}/status", response_model=UserSchema)
 def update_user_approval_status(
@@ -22,15 +38,86 @@ def update_user_approval_status(
     if approval_data.action not in ["approve", "reject"]:
         raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
     
-    user_to_update = db.query(User).filter(User.id == user_id).first()
+    user_to_update = db.get(User, user_id)
     if not user_to_update:
         raise HTTPException(status_code=404, detail="User not found")
     
     user_to_update.is_approved = True if approval_data.action == "approve" else False
     db.commit()
-    db.refresh(user_to_update)
+    deps.invalidate_user(user_id)
     return user_to_update
 
+@router.post("/users/bulk-approve")
+def bulk_update_user_approval_status(
+    approval_data: UserBulkApprovalUpdate,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_superadmin)
+):
+    """
+    Update the approval status of many users in one request. (SUPERADMIN only)
+    Send JSON body: {"user_ids": [1, 2, 3], "action": "approve"} or "reject"
+    """
+    if approval_data.action not in ["approve", "reject"]:
+        raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
+    
+    user_ids = set(approval_data.user_ids)
+    found_ids = {user_id for user_id, in db.query(User.id).filter(User.id.in_(user_ids))} if user_ids else set()
+    missing_ids = user_ids - found_ids
+    if missing_ids:
+        raise HTTPException(status_code=404, detail=f"Users not found: {', '.join(map(str, sorted(missing_ids)))}")
+    
+    updated_count = 0
+    if user_ids:
+        updated_count = db.query(User).filter(User.id.in_(user_ids)).update(
+            {User.is_approved: approval_data.action == "approve"}, synchronize_session=False
+        )
+        db.commit()
+        for user_id in user_ids:
+            deps.invalidate_user(user_id)
+    
+    return {"message": f"Updated {updated_count} users", "updated_count": updated_count}
+
+@router.post("/users/bulk-update", response_model=List[UserSchema])
+def bulk_update_users(
+    updates: List[UserBulkUpdateItem],
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_superadmin)
+):
+    """
+    Apply role, credit and approval changes to many users in one transaction. (SUPERADMIN only)
+    Send JSON body: [{"user_id": 2, "new_role": "ORGANIZER", "new_limit": 5, "action": "approve"}, ...]
+    Only the fields given in each entry are changed.
+    """
+    for update in updates:
+        if update.action is not None and update.action not in ["approve", "reject"]:
+            raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
+        # Prevent superadmin from changing their own role, credits or approval
+        if update.user_id == current_user.id:
+            raise HTTPException(status_code=400, detail="Cannot change your own account")
+    
+    # Load every affected user in one query
+    user_ids = {update.user_id for update in updates}
+    users = {user.id: user for user in db.query(User).filter(User.id.in_(user_ids))} if user_ids else {}
+    missing_ids = user_ids - users.keys()
+    if missing_ids:
+        raise HTTPException(status_code=404, detail=f"Users not found: {', '.join(map(str, sorted(missing_ids)))}")
+    
+    for update in updates:
+        user_to_update = users[update.user_id]
+        if update.new_role is not None:
+            user_to_update.role = update.new_role
+        if update.new_limit is not None:
+            user_to_update.auction_limit = update.new_limit
+        if update.action is not None:
+            user_to_update.is_approved = update.action == "approve"
+    
+    # One commit for the whole batch
+    db.commit()
+    for user_id in user_ids:
+        deps.invalidate_user(user_id)
+    
+    return list(users.values())
+
 @router.get("/users/by-status", response_model=List[UserSchema])
 def get_users_by_approval_status(
     status: str,  # "pending", "approved", "rejected"
@@ -41,16 +128,13 @@ def get_users_by_approval_status(
     Get users by approval status. (SUPERADMIN only)
     Status: 'pending', 'approved', 'rejected'
     """
-    if status == "pending":
-        users = db.query(User).filter(User.is_approved.is_(None)).all()
-    elif status == "approved":
-        users = db.query(User).filter(User.is_approved == True).all()
-    elif status == "rejected":
-        users = db.query(User).filter(User.is_approved == False).all()
-    else:
+    status_filter = _APPROVAL_STATUS_FILTERS.get(status)
+    if status_filter is None:
         raise HTTPException(status_code=400, detail="Status must be 'pending', 'approved', or 'rejected'")
     
-    return users
+    users = db.query(User).filter(status_filter).all()
+    content = _USER_LIST.dump_json([construct_from_orm(UserSchema, user) for user in users])
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/organizers", response_model=List[UserSchema])
@@ -61,8 +145,10 @@ def get_all_organizers(
     """
     Get a list of all organizer users. (SUPERADMIN only)
     """
+    # Not cached: approvals and role changes made through any worker must show up at once
     organizers = db.query(User).filter(User.role == Role.ORGANIZER).all()
-    return organizers
+    content = _USER_LIST.dump_json([construct_from_orm(UserSchema, user) for user in organizers])
+    return Response(content=content, media_type="application/json")
 
 @router.post("/users/{user_id}/assign-role", response_model=UserSchema)
 def assign_user_role(
@@ -75,7 +161,7 @@ def assign_user_role(
     Assign role to an approved user. (SUPERADMIN only)
     Send JSON body: {"new_role": "ORGANIZER"} or {"new_role": "USER"}
     """
-    user_to_update = db.query(User).filter(User.id == user_id).first()
+    user_to_update = db.get(User, user_id)
     if not user_to_update:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -85,7 +171,7 @@ def assign_user_role(
     
     user_to_update.role = role_data.new_role
     db.commit()
-    db.refresh(user_to_update)
+    deps.invalidate_user(user_id)
     return user_to_update
 
 @router.post("/users/{user_id}/assign-credit", response_model=UserSchema)
@@ -99,11 +185,11 @@ def assign_user_credit(
     Assign auction credit/limit to a user. (SUPERADMIN only)
     Send JSON body: {"new_limit": 5}
     """
-    user_to_update = db.query(User).filter(User.id == user_id).first()
+    user_to_update = db.get(User, user_id)
     if not user_to_update:
         raise HTTPException(status_code=404, detail="User not found")
     
     user_to_update.auction_limit = credit_data.new_limit
     db.commit()
-    db.refresh(user_to_update)
+    deps.invalidate_user(user_id)
     return user_to_update
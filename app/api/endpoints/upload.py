@@ -5,20 +5,37 @@ Handles file upload operations using S3 presigned URLs.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from app.api import deps
 from app.models import User
 from app.utils.s3_helper import s3_helper
 from app.enums import UploadType
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# These handlers only talk to S3: they release the DB connection as soon as
+# the user is authenticated and run the blocking boto3 calls in the
+# threadpool instead of holding a worker thread for the whole request.
+AUTHENTICATED_USER = Depends(deps.get_authenticated_user)
+
+# Upload type -> S3 folder, and the image types accepted for upload
+_FOLDER_BY_UPLOAD_TYPE = {
+    "player_photo": UploadType.PLAYER_PHOTO.value,
+    "team_logo": UploadType.TEAM_LOGO.value,
+    "tournament_logo": UploadType.TOURNAMENT_LOGO.value,
+}
+_CONTENT_TYPES = ('image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp')
+_ALLOWED_CONTENT_TYPES = frozenset(_CONTENT_TYPES)
+# Error message lists, joined once
+_SUPPORTED_UPLOAD_TYPES = ", ".join(_FOLDER_BY_UPLOAD_TYPE)
+_SUPPORTED_CONTENT_TYPES = ", ".join(_CONTENT_TYPES)
 
 @router.post("/presigned-url", tags=["File Upload"])
-def generate_upload_url(
+async def generate_upload_url(
     upload_type: str = Query("player_photo", description="Type of upload: player_photo or team_logo"),
     content_type: str = Query("image/jpeg", description="MIME type of the image file"),
-    current_user: User = Depends(deps.get_current_user)
+    current_user: User = AUTHENTICATED_USER
 ):
     """
     Generate a presigned URL for uploading image files to S3.
@@ -31,35 +48,24 @@ def generate_upload_url(
     Supported image types:
     - image/jpeg, image/jpg, image/png, image/gif, image/webp
     """
-    # Validate content type - only images allowed
-    allowed_types = [
-        'image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp'
-    ]
-    
     # Validate upload type
-    allowed_upload_types = ["player_photo", "team_logo","tournament_logo"]
-    if upload_type not in allowed_upload_types:
+    if upload_type not in _FOLDER_BY_UPLOAD_TYPE:
         raise HTTPException(
             status_code=400,
-            detail=f"Upload type '{upload_type}' not allowed. Supported types: {', '.join(allowed_upload_types)}"
+            detail=f"Upload type '{upload_type}' not allowed. Supported types: {_SUPPORTED_UPLOAD_TYPES}"
         )
     
-    if content_type not in allowed_types:
+    # Validate content type - only images allowed
+    if content_type not in _ALLOWED_CONTENT_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Content type '{content_type}' not allowed. Supported types: {', '.join(allowed_types)}"
+            detail=f"Content type '{content_type}' not allowed. Supported types: {_SUPPORTED_CONTENT_TYPES}"
         )
     
-    # Map upload type to S3 folder
-    folder_mapping = {
-        "player_photo": UploadType.PLAYER_PHOTO.value,
-        "team_logo": UploadType.TEAM_LOGO.value,
-        "tournament_logo": UploadType.TOURNAMENT_LOGO.value,
-    }
-    
     # Generate presigned URL for image upload
-    result = s3_helper.generate_presigned_upload_url(
-        file_type=folder_mapping[upload_type],
+    result = await run_in_threadpool(
+        s3_helper.generate_presigned_upload_url,
+        file_type=_FOLDER_BY_UPLOAD_TYPE[upload_type],
         content_type=content_type,
         expiration=3600  # 1 hour
     )
@@ -79,9 +85,9 @@ def generate_upload_url(
     }   
 
 @router.get("/download-url", tags=["File Upload"])
-def generate_download_url(
+async def generate_download_url(
     file_url: str = Query(..., description="S3 file URL to generate download link for"),
-    current_user: User = Depends(deps.get_current_user)
+    current_user: User = AUTHENTICATED_USER
 ):
     """
     Generate a presigned URL for downloading/viewing files from S3.
@@ -96,7 +102,8 @@ def generate_download_url(
         )
     
     # Generate presigned download URL
-    download_url = s3_helper.generate_presigned_download_url(
+    download_url = await run_in_threadpool(
+        s3_helper.generate_presigned_download_url,
         file_key=file_key,
         expiration=3600  # 1 hour
     )
@@ -108,9 +115,9 @@ def generate_download_url(
     }
 
 @router.delete("/file", tags=["File Upload"])
-def delete_file(
+async def delete_file(
     file_url: str = Query(..., description="S3 file URL to delete"),
-    current_user: User = Depends(deps.get_current_user)
+    current_user: User = AUTHENTICATED_USER
 ):
     """
     Delete a file from S3 storage.
@@ -125,7 +132,7 @@ def delete_file(
         )
     
     # Delete file
-    success = s3_helper.delete_file(file_key)
+    success = await run_in_threadpool(s3_helper.delete_file, file_key)
     
     if success:
         return {
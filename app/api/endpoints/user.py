@@ -1,23 +1,27 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.dto.user_dto import User as UserSchema, updateUser
 from app.models import User
 from app.api import deps
+from app.utils.serializers import construct_from_orm
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/me", response_model=UserSchema, tags=["User"])
-def get_current_user(current_user: User = Depends(deps.get_current_user)):
+async def get_current_user(current_user: User = Depends(deps.get_current_user_fresh)):
 
-    return current_user
+    # The user row is trusted; build the response without re-validating it
+    content = construct_from_orm(UserSchema, current_user).model_dump_json()
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/update", response_model=UserSchema, tags=["User"])
 def update_current_user(
     request: updateUser,
-    current_user: User = Depends(deps.get_current_user),
+    current_user: User = Depends(deps.get_current_user_fresh),
     db: Session = Depends(deps.get_db)
  ):
 
@@ -28,7 +32,7 @@ def update_current_user(
         current_user.last_name = request.last_name
 
     db.commit()
-    db.refresh(current_user)
+    deps.invalidate_user(current_user.id)
 
     return current_user
 
@@ -3,5 +3,7 @@ from .security import (
     get_password_hash, 
     verify_password, 
     create_access_token, 
-    create_refresh_token
+    create_refresh_token,
+    decode_token,
+    hash_token
 )
\ No newline at end of file
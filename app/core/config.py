@@ -1,15 +1,32 @@
 import os
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-load_dotenv()
+# Production injects its environment directly; skip reading .env from disk there
+if os.getenv("ENVIRONMENT") != "production":
+    load_dotenv()
 
 class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL")
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    TOKEN_PURGE_INTERVAL_SECONDS: int = int(os.getenv("TOKEN_PURGE_INTERVAL_SECONDS", 300))
     ALGORITHM: str = "HS256"
+
+    # "production" disables development-only query guards
+    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "production")
+
+    # "1" creates missing tables and applies Alembic migrations on startup;
+    # run one process with it set per deploy
+    RUN_MIGRATIONS: bool = os.getenv("RUN_MIGRATIONS") == "1"
+
+    # Database connection pool
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 20))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 40))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 5))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
     
     # AWS S3 Configuration (Optional)
     AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
@@ -32,7 +49,11 @@ class Settings(BaseSettings):
     # Backend URL
     BACKEND_URL: str = os.getenv("BACKEND_URL", "http://localhost:8000")
 
-    class Config:
-        case_sensitive = True
+    model_config = SettingsConfigDict(case_sensitive=True)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once and reuse them for the life of the process."""
+    return Settings()
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -1,33 +1,78 @@
-from datetime import datetime, timedelta
+import hashlib
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+import jwt
 from app.core.config import settings
 
-# Create a password context for hashing and verifying passwords
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Create a password context for hashing and verifying passwords.
+# New hashes use argon2id (argon2-cffi C backend, OWASP 46 MiB profile);
+# bcrypt stays in the context so existing hashes keep verifying and get
+# upgraded to argon2 on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=46 * 1024,
+    argon2__parallelism=1,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed one."""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verifies a password and returns a replacement hash if the stored one is outdated."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+def dummy_verify() -> bool:
+    """Spends the same time as a real verify so unknown emails can't be told apart by latency."""
+    return pwd_context.dummy_verify()
+
 def get_password_hash(password: str) -> str:
     """Hashes a plain password."""
     return pwd_context.hash(password)
 
 
+# The signing key and algorithm are fixed for the life of the process, so
+# read them once and build the decoder and prepared key up front instead of
+# on every request.
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [ALGORITHM]
+_jwt_decoder = jwt.PyJWT()
+_decode_key = jwt.get_algorithm_by_name(ALGORITHM).prepare_key(SECRET_KEY)
+
+def decode_token(token: str) -> dict:
+    """Verifies a token's signature and expiry and returns its payload."""
+    return _jwt_decoder.decode(token, _decode_key, algorithms=_ALGORITHMS)
+
+ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+REFRESH_TOKEN_LIFETIME = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+def utcnow() -> datetime:
+    """Returns the current UTC time as a naive datetime, matching the DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 def create_access_token(data: dict):
     """Creates a short-lived access token."""
     to_encode = data.copy()
-    expire = datetime.now() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # PyJWT reads naive datetimes as UTC, so the expiry must be computed in UTC
+    expire = datetime.now(timezone.utc) + ACCESS_TOKEN_LIFETIME
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def create_refresh_token(data: dict):
     """Creates a long-lived refresh token."""
     to_encode = data.copy()
-    expire = datetime.now() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    expire = datetime.now(timezone.utc) + REFRESH_TOKEN_LIFETIME
+    # A unique jti keeps every issued refresh token distinct
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def hash_token(token: str) -> bytes:
+    """Returns the SHA-256 digest used to store and look up a token."""
+    return hashlib.sha256(token.encode()).digest()
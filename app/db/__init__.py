@@ -1,2 +1,3 @@
 from .base import Base
 from .session import engine, SessionLocal
+from .loading import strict_loading
@@ -0,0 +1,11 @@
+from sqlalchemy.orm import raiseload
+from app.core.config import settings
+
+# Outside production, any relationship a list query did not eager-load raises
+# instead of quietly issuing one SELECT per row.
+_STRICT_LOADING = settings.ENVIRONMENT != "production"
+
+
+def strict_loading() -> tuple:
+    """Loader options to append after a query's explicit eager loads."""
+    return (raiseload("*"),) if _STRICT_LOADING else ()
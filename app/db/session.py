@@ -2,5 +2,16 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Absorbs bid bursts during a live auction
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # Fail fast instead of queueing requests behind a saturated pool
+    pool_pre_ping=True,  # Drop connections the server has closed
+    pool_use_lifo=True,  # Reuse the most recent connection so idle ones can be recycled
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    query_cache_size=1200,  # Room for every distinct statement shape the API issues
+)
+# Handlers return ORM objects after committing; keeping them loaded avoids a
+# re-SELECT per object when the response model serializes them.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
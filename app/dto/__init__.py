@@ -1,3 +1,3 @@
-from .user_dto import User, UserCreate, UserLimitUpdate, UserRoleUpdate, UserApprovalUpdate
+from .user_dto import User, UserCreate, UserLimitUpdate, UserRoleUpdate, UserApprovalUpdate, UserBulkApprovalUpdate, UserBulkUpdateItem
 from .token_dto import Token, TokenPayload, RefreshTokenRequest
 from .tournament_dto import TournamentResponse, TournamentCreate, Season, SeasonCreate, Player, PlayerCreate, PlayerSelectionUpdate
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -38,8 +38,12 @@ class AuctionPlayerResponse(BaseModel):
     player: dict  # Player details
     max_bid_allowed: Optional[Decimal] = None  # Maximum bid this player can receive
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+# Returned by next-player when no pending player is left in the round
+class AuctionActionRequired(BaseModel):
+    message: str
+    action_required: str  # "start_next_round" or "auction_complete"
 
 class TeamOverview(BaseModel):
     team_id: int
@@ -75,6 +79,10 @@ class AuctionPlayersList(BaseModel):
     auction_status: AuctionStatus
     auction_round: int
 
+class SeasonSummary(BaseModel):
+    teams: List[TeamOverview]
+    players: List[AuctionPlayersList]
+
 class BudgetValidation(BaseModel):
     team_id: int
     can_bid: bool
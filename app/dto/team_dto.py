@@ -1,4 +1,4 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -32,8 +32,7 @@ class Team(BaseModel):
     updated_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Team Season DTOs
 class TeamSeasonCreate(BaseModel):
@@ -50,12 +49,11 @@ class TeamSeason(BaseModel):
     remaining_budget: float
     total_budget: float
     created_at: datetime
-    updated_at: datetime
+    updated_at: Optional[datetime] = None  # team_seasons has no updated_at column
     is_active: bool
     team: Team
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Auction Configuration DTOs
 class AuctionConfigCreate(BaseModel):
@@ -91,8 +89,7 @@ class AuctionConfig(BaseModel):
     auction_configured: bool
     auction_started: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Player Purchase DTOs
 class PlayerPurchase(BaseModel):
@@ -105,8 +102,7 @@ class PlayerPurchase(BaseModel):
     updated_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Team Registration DTO
 class TeamRegistrationCreate(BaseModel):
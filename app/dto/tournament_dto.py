@@ -1,5 +1,4 @@
-from unicodedata import category
-from pydantic import BaseModel, field_validator, HttpUrl, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator, HttpUrl
 from typing import Optional, List
 from datetime import datetime
 from app.enums.player_type import BattingStyle, BowlingStyle, PlayerRole
@@ -10,8 +9,7 @@ class TournamentCreate(BaseModel):
     description: Optional[str] = None
     category: str
     logo: Optional[HttpUrl] = None 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TournamentResponse(BaseModel):
     id: int
@@ -22,10 +20,10 @@ class TournamentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     is_active: bool
-    logo: Optional[HttpUrl] = None
+    # Output only; plain str skips re-parsing the URL on every response
+    logo: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Season DTOs
 class SeasonCreate(BaseModel):
@@ -43,8 +41,7 @@ class Season(BaseModel):
     is_active: bool
     tournament: TournamentResponse
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Player DTOs
 class PlayerCreate(BaseModel):
@@ -83,8 +80,7 @@ class Player(BaseModel):
     updated_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Player Season DTOs
 class PlayerSeason(BaseModel):
@@ -98,8 +94,7 @@ class PlayerSeason(BaseModel):
     updated_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Player Selection DTO
 class PlayerSelectionUpdate(BaseModel):
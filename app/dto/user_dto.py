@@ -1,8 +1,12 @@
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from typing import List, Optional
 import re
 from app.enums import Role
 
+# Built once for the signup mobile check
+_NON_DIGIT = re.compile(r'[^\d]')
+_MOBILE_FIRST_DIGITS = frozenset('6789')
+
 # This new schema is for the admin endpoint to set an auction limit
 class UserLimitUpdate(BaseModel):
     new_limit: int
@@ -15,6 +19,18 @@ class UserRoleUpdate(BaseModel):
 class UserApprovalUpdate(BaseModel):
     action: str  # "approve" or "reject"
 
+# One entry of the superadmin bulk update; only the fields that are set are applied
+class UserBulkUpdateItem(BaseModel):
+    user_id: int
+    new_role: Optional[Role] = None
+    new_limit: Optional[int] = None
+    action: Optional[str] = None  # "approve" or "reject"
+
+# This schema is for the superadmin endpoint to approve or reject many users at once
+class UserBulkApprovalUpdate(BaseModel):
+    user_ids: List[int]
+    action: str  # "approve" or "reject"
+
 # This schema for creating a user with mobile validation
 class UserCreate(BaseModel):
     first_name: str
@@ -26,25 +42,28 @@ class UserCreate(BaseModel):
     @field_validator('mobile')
     def validate_mobile(cls, v):
         
-        # Remove any spaces or special characters
-        mobile_clean = re.sub(r'[^\d]', '', v)
+        # Remove any spaces or special characters; most clients already
+        # send bare digits, so skip the substitution for those
+        mobile_clean = v if v.isascii() and v.isdigit() else _NON_DIGIT.sub('', v)
         
         # Check if exactly 10 digits
         if len(mobile_clean) != 10:
             raise ValueError('Mobile number must be exactly 10 digits')
         
         # Check if starts with 6, 7, 8, or 9
-        if not mobile_clean[0] in ['6', '7', '8', '9']:
+        if mobile_clean[0] not in _MOBILE_FIRST_DIGITS:
             raise ValueError('Mobile number must start with 6, 7, 8, or 9')
         
         return mobile_clean
 
 # This is the main response schema, updated with the new fields
+# Built from stored rows only; the email was validated on signup, so it is
+# not parsed again on every response
 class User(BaseModel):
     id: int
     first_name: str
     last_name: str
-    email: EmailStr
+    email: str
     mobile: str
     role: Role
     is_approved: Optional[bool]     
@@ -52,8 +71,7 @@ class User(BaseModel):
     auction_limit: int          
     auctions_created: int       
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class updateUser(BaseModel):
     first_name: Optional[str]
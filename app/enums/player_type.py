@@ -1,10 +1,10 @@
 from enum import Enum
 
-class BattingStyle(Enum):
+class BattingStyle(str, Enum):
     RIGHT_HANDED = "right_handed"
     LEFT_HANDED = "left_handed"
 
-class BowlingStyle(Enum):
+class BowlingStyle(str, Enum):
     RIGHT_ARM_FAST = "right_arm_fast"
     LEFT_ARM_FAST = "left_arm_fast"
     RIGHT_ARM_MEDIUM = "right_arm_medium"
@@ -14,9 +14,29 @@ class BowlingStyle(Enum):
     RIGHT_ARM_OFFBREAK = "right_arm_offbreak"
     LEFT_ARM_ORTHODOX = "left_arm_orthodox"
 
-class PlayerRole(Enum):
+class PlayerRole(str, Enum):
     WICKETKEEPER = "wicketkeeper"
     BATSMAN = "batsman"
     BOWLER = "bowler"
     ALLROUNDER = "allrounder"
     WICKETKEEPER_BATSMAN = "wicketkeeper_batsman"
+
+    @classmethod
+    def from_skills(cls, is_wicketkeeper: bool, is_batsman: bool, is_bowler: bool) -> "PlayerRole":
+        """Derive the role from the player's skill flags."""
+        # Flags may be None on partially filled rows, so coerce before packing
+        return _ROLE_TABLE[(bool(is_wicketkeeper) << 2) | (bool(is_batsman) << 1) | bool(is_bowler)]
+
+
+# Indexed by (is_wicketkeeper << 2) | (is_batsman << 1) | is_bowler;
+# a player with no skill selected defaults to batsman
+_ROLE_TABLE = (
+    PlayerRole.BATSMAN,
+    PlayerRole.BOWLER,
+    PlayerRole.BATSMAN,
+    PlayerRole.ALLROUNDER,
+    PlayerRole.WICKETKEEPER,
+    PlayerRole.WICKETKEEPER,
+    PlayerRole.WICKETKEEPER_BATSMAN,
+    PlayerRole.WICKETKEEPER_BATSMAN,
+)
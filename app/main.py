@@ -1,19 +1,82 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import orjson
+from contextlib import asynccontextmanager
+from pathlib import Path
+from anyio import to_thread
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.endpoints import auth, superadmin, organizer, upload, user  # Import all routers
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import engine, SessionLocal
+from app.core import settings
+from app.managers import DataManager
+from app.utils.etag import ETagMiddleware
 from app.models import User, Token
 from app.models.tournament import Tournament, Season
 from app.models.player import Player, PlayerSeason
 from app.models.team import Team, TeamSeason, PlayerPurchase
 
-# This command tells SQLAlchemy to create all database tables based on your models
-# It should be run once at startup.
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+
+def _run_migrations() -> None:
+    """Create missing tables, then bring existing ones up to the latest Alembic revision."""
+    # Imported here so ordinary workers never load Alembic
+    from alembic import command
+    from alembic.config import Config
+
+    Base.metadata.create_all(bind=engine)
+    config = Config(str(Path(__file__).resolve().parent.parent / "alembic.ini"))
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
+def _purge_expired_tokens() -> int:
+    db = SessionLocal()
+    try:
+        return DataManager.purge_expired_tokens(db)
+    finally:
+        db.close()
+
+
+async def _purge_expired_tokens_periodically():
+    """
+    Sweep expired refresh tokens so they don't pile up between refreshes.
+    Every worker runs this loop; purge_expired_tokens lets only one sweep at a time.
+    """
+    while True:
+        try:
+            await run_in_threadpool(_purge_expired_tokens)
+        except Exception:
+            logger.exception("Expired token purge failed")
+        await asyncio.sleep(settings.TOKEN_PURGE_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints run in AnyIO's worker threads (40 by default). Size that
+    # pool to the DB pool so concurrent requests never queue on a free thread
+    # while a connection is available, or block on connection checkout.
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    # Create missing tables and apply pending migrations. Only one process
+    # needs to do this, so it is opt-in; other workers leave the schema alone.
+    if settings.RUN_MIGRATIONS:
+        await run_in_threadpool(_run_migrations)
+    purge_task = asyncio.create_task(_purge_expired_tokens_periodically())
+    yield
+    purge_task.cancel()
 
 # 1. Create the FastAPI application with enhanced OpenAPI configuration
 app = FastAPI(
+    lifespan=lifespan,
+    # Routers without their own default serialize with orjson as well
+    default_response_class=ORJSONResponse,
     title="Cricket Auction Management API",
     version="1.0.0",
     description="""
@@ -100,6 +163,14 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# Lets pollers revalidate GETs with If-None-Match and receive 304s when
+# nothing changed
+app.add_middleware(ETagMiddleware)
+
+# Added last so it wraps the ETag layer: tags are computed on the plain JSON
+# and large list payloads are compressed on the way out.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # 2. Include routers
 # Public routes
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -115,7 +186,10 @@ app.include_router(upload.router, prefix="/api/upload", tags=["File Upload"])
 
 app.include_router(user.router, prefix="/api/user", tags=["User"])
 
+# The root payload never changes, so encode it once at import
+_ROOT_BODY = orjson.dumps({"message": "Welcome to the Cricket Auction API"})
+
 # A simple root endpoint to confirm the API is running.
 @app.get("/")
-def read_root():
-    return {"message": "Welcome to the Cricket Auction API"}
\ No newline at end of file
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -5,10 +5,14 @@ Handles auction-specific calculations and validations.
 """
 
 from decimal import Decimal
+from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session
 from app.models.team import TeamSeason as TeamSeasonModel
 from app.enums.player_type import PlayerRole
 
+# Shared zero so rejected bids don't build a fresh Decimal each call
+_ZERO = Decimal('0')
+
 
 class AuctionManager:
     """Manager for auction-related calculations and operations."""
@@ -18,20 +22,24 @@ class AuctionManager:
         """
         Calculate maximum bid amount any team can place for a player.
         """
-        # Get all teams and their current status
-        team_seasons = db.query(TeamSeasonModel).filter(
+        # A team's ceiling is its remaining budget less base price for every
+        # slot it still has to fill after this player; the database works it
+        # out for all teams and returns only the highest.
+        max_bid_amount = TeamSeasonModel.remaining_budget - (
+            TeamSeasonModel.max_players - TeamSeasonModel.current_players - 1
+        ) * base_price
+        max_possible_bid = db.query(func.max(case(
+            (and_(
+                TeamSeasonModel.current_players < TeamSeasonModel.max_players,
+                max_bid_amount >= base_price
+            ), max_bid_amount),
+            else_=0
+        ), type_=TeamSeasonModel.remaining_budget.type)).filter(
             TeamSeasonModel.season_id == season_id,
             TeamSeasonModel.is_active == True
-        ).all()
-        
-        max_possible_bid = Decimal('0')
-        
-        for team_season in team_seasons:
-            validation = AuctionManager.validate_team_budget(db, team_season, team_season.remaining_budget, base_price)
-            if validation["can_bid"] and validation["max_bid_amount"] > max_possible_bid:
-                max_possible_bid = validation["max_bid_amount"]
+        ).scalar()
         
-        return max_possible_bid
+        return max_possible_bid if max_possible_bid is not None else _ZERO
 
     @staticmethod
     def validate_team_budget(db: Session, team_season: TeamSeasonModel, bid_amount: Decimal, base_price: Decimal) -> dict:
@@ -42,7 +50,7 @@ class AuctionManager:
         if team_season.current_players >= team_season.max_players:
             return {
                 "can_bid": False,
-                "max_bid_amount": Decimal('0'),
+                "max_bid_amount": _ZERO,
                 "reason": "Team has reached maximum player limit"
             }
         
@@ -50,7 +58,7 @@ class AuctionManager:
         if bid_amount > team_season.remaining_budget:
             return {
                 "can_bid": False,
-                "max_bid_amount": Decimal('0'),
+                "max_bid_amount": _ZERO,
                 "reason": "Insufficient budget for this bid"
             }
         
@@ -66,7 +74,7 @@ class AuctionManager:
         if max_bid_amount < base_price:
             return {
                 "can_bid": False,
-                "max_bid_amount": Decimal('0'),
+                "max_bid_amount": _ZERO,
                 "reason": f"Need to reserve ₹{min_budget_for_remaining} for {remaining_players_needed} more players"
             }
         
@@ -88,16 +96,4 @@ class AuctionManager:
         """
         Auto-calculate player role based on selected skills.
         """
-        if is_wicketkeeper and is_batsman:
-            return PlayerRole.WICKETKEEPER_BATSMAN
-        elif is_wicketkeeper:
-            return PlayerRole.WICKETKEEPER
-        elif is_batsman and is_bowler:
-            return PlayerRole.ALLROUNDER
-        elif is_batsman:
-            return PlayerRole.BATSMAN
-        elif is_bowler:
-            return PlayerRole.BOWLER
-        else:
-            # Default to batsman if no role selected
-            return PlayerRole.BATSMAN
+        return PlayerRole.from_skills(is_wicketkeeper, is_batsman, is_bowler)
@@ -5,8 +5,17 @@ Handles database operations and data persistence.
 """
 
 from decimal import Decimal
+from typing import List
+from sqlalchemy import Update, delete, func, insert, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from app.models.team import TeamSeason as TeamSeasonModel, PlayerPurchase as PlayerPurchaseModel
+from app.models.token import Token as TokenModel
+from app.models.user import User as UserModel
+from app.core.security import utcnow
+
+# Held by whichever worker is purging expired tokens (transaction-scoped, so PgBouncer-safe)
+_TOKEN_PURGE_LOCK_ID = 7_301_001
 
 
 class DataManager:
@@ -27,8 +36,111 @@ class DataManager:
         )
         
         # Update team budget and player count
-        team_season.remaining_budget -= purchase_price
-        team_season.current_players += 1
+        DataManager.charge_team(team_season, purchase_price)
         
         db.add(player_purchase)
         return player_purchase
+
+    @staticmethod
+    def charge_team(team_season: TeamSeasonModel, purchase_price: Decimal) -> None:
+        """
+        Apply one purchase to a team's remaining budget and player count.
+        """
+        team_season.remaining_budget -= purchase_price
+        team_season.current_players += 1
+
+    @staticmethod
+    def create_player_purchases(db: Session, purchases: List[dict]) -> None:
+        """
+        Insert many player purchase rows with a single executemany INSERT.
+        Callers charge each team with charge_team as they validate its purchases.
+        """
+        if purchases:
+            db.execute(insert(PlayerPurchaseModel), purchases)
+
+    @staticmethod
+    def record_player_sale(db: Session, team_season: TeamSeasonModel, player_id: int, purchase_price: Decimal) -> None:
+        """
+        Record a single sale: insert the purchase and charge the team.
+        On PostgreSQL both writes go out as one statement.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            DataManager.create_player_purchase(db, team_season, player_id, purchase_price)
+            return
+
+        charged = db.execute(
+            DataManager.player_sale_statement(team_season.id, player_id, purchase_price)
+        ).one()
+
+        # Reflect the new totals without marking the team dirty again
+        set_committed_value(team_season, "remaining_budget", charged.remaining_budget)
+        set_committed_value(team_season, "current_players", charged.current_players)
+
+    @staticmethod
+    def player_sale_statement(team_season_id: int, player_id: int, purchase_price: Decimal) -> Update:
+        """
+        The PostgreSQL statement behind record_player_sale:
+        WITH purchase AS (INSERT ... RETURNING ...) UPDATE team_seasons ... FROM purchase
+        """
+        purchase = insert(PlayerPurchaseModel).values(
+            team_season_id=team_season_id,
+            player_id=player_id,
+            purchase_price=purchase_price,
+            is_icon_player=False
+        ).returning(PlayerPurchaseModel.team_season_id, PlayerPurchaseModel.purchase_price).cte("purchase")
+        return (
+            update(TeamSeasonModel)
+            .where(TeamSeasonModel.id == purchase.c.team_season_id)
+            .values(
+                remaining_budget=TeamSeasonModel.remaining_budget - purchase.c.purchase_price,
+                current_players=TeamSeasonModel.current_players + 1
+            )
+            .returning(TeamSeasonModel.remaining_budget, TeamSeasonModel.current_players)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def consume_auction_credit(db: Session, user_id: int) -> bool:
+        """
+        Atomically use one auction credit if the user has any left.
+        Returns False when the limit is already reached.
+        """
+        # The check and the increment happen in one statement, so concurrent
+        # season creations can't both take the last credit
+        result = db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.auctions_created < UserModel.auction_limit)
+            .values(auctions_created=UserModel.auctions_created + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def purge_expired_tokens(db: Session, batch_size: int = 10_000) -> int:
+        """
+        Delete expired refresh tokens in batches and return the number removed.
+        On PostgreSQL each batch first takes an advisory lock, and a worker that
+        finds it held stops, leaving the sweep to the worker already running it.
+        """
+        use_lock = db.get_bind().dialect.name == "postgresql"
+        purged = 0
+        while True:
+            if use_lock and not db.scalar(select(func.pg_try_advisory_xact_lock(_TOKEN_PURGE_LOCK_ID))):
+                return purged
+
+            # Select ids first so each DELETE stays bounded on every backend
+            expired_ids = db.scalars(
+                select(TokenModel.id)
+                .where(TokenModel.expires_at < utcnow())
+                .limit(batch_size)
+            ).all()
+            if not expired_ids:
+                return purged
+
+            db.execute(
+                delete(TokenModel)
+                .where(TokenModel.id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            purged += len(expired_ids)
@@ -5,9 +5,29 @@ Handles all validation logic including ownership, auction status, and business r
 """
 
 from fastapi import HTTPException
+from sqlalchemy import Row, bindparam, select
 from sqlalchemy.orm import Session
 from app.models import User
 from app.models.tournament import Tournament as TournamentModel, Season as SeasonModel
+from app.utils.cache import TTLCache
+
+# Season settings read by endpoints that never modify the season
+_SEASON_SETTINGS = select(
+    SeasonModel.id,
+    SeasonModel.created_by,
+    SeasonModel.registration_open,
+    SeasonModel.auction_configured,
+    SeasonModel.auction_started,
+    SeasonModel.base_price,
+    SeasonModel.max_players_per_team,
+    SeasonModel.total_budget_per_team,
+    SeasonModel.current_auction_round,
+).where(SeasonModel.id == bindparam("season_id"))
+
+# Owner ids of active seasons whose ownership was recently confirmed, keyed
+# by season id. The owner never changes, but a season can be deactivated or
+# deleted, so only active seasons are remembered, and only for a few seconds.
+_confirmed_season_owners = TTLCache(maxsize=10_000, ttl=10)
 
 
 class ValidationManager:
@@ -19,28 +39,56 @@ class ValidationManager:
         Validate that the season exists and belongs to the current organizer.
         Returns the season object if valid, raises HTTPException otherwise.
         """
-        season = db.query(SeasonModel).filter(
-            SeasonModel.id == season_id,
-            SeasonModel.created_by == current_user.id
-        ).first()
+        # Primary-key fetch; reuses the identity map when the season is already loaded
+        season = db.get(SeasonModel, season_id)
+        
+        if not season or season.created_by != current_user.id:
+            raise HTTPException(status_code=404, detail="Season not found or access denied")
+        
+        return season
+
+    @staticmethod
+    def validate_season_settings(db: Session, season_id: int, current_user: User) -> Row:
+        """
+        Validate season ownership for read-only callers.
+        Returns just the season's settings columns as a row instead of a Season object.
+        """
+        # Remembered on the session, so validators chained within one request
+        # share a single lookup; the session lives only as long as the request
+        settings_by_season = db.info.setdefault("season_settings", {})
+        season = settings_by_season.get(season_id)
+        if season is None:
+            season = db.execute(_SEASON_SETTINGS, {"season_id": season_id}).first()
+            if season:
+                settings_by_season[season_id] = season
         
-        if not season:
+        if not season or season.created_by != current_user.id:
             raise HTTPException(status_code=404, detail="Season not found or access denied")
         
         return season
 
+    @staticmethod
+    def ensure_season_ownership(db: Session, season_id: int, current_user: User) -> None:
+        """
+        Validate season ownership for callers that don't need the season row.
+        Confirmed ownership of an active season is remembered briefly so repeat
+        polls skip the query.
+        """
+        if _confirmed_season_owners.get(season_id) == current_user.id:
+            return
+        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        if season.is_active:
+            _confirmed_season_owners.set(season_id, current_user.id)
+
     @staticmethod
     def validate_tournament_ownership(db: Session, tournament_id: int, current_user: User) -> TournamentModel:
         """
         Validate that the tournament exists and belongs to the current organizer.
         Returns the tournament object if valid, raises HTTPException otherwise.
         """
-        tournament = db.query(TournamentModel).filter(
-            TournamentModel.id == tournament_id,
-            TournamentModel.created_by == current_user.id
-        ).first()
+        tournament = db.get(TournamentModel, tournament_id)
         
-        if not tournament:
+        if not tournament or tournament.created_by != current_user.id:
             raise HTTPException(status_code=404, detail="Tournament not found or access denied")
         
         return tournament
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Text, UniqueConstraint
+from sqlalchemy import event, func, Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.db.base import Base
 from app.enums.player_type import BattingStyle, BowlingStyle, PlayerRole
 from app.enums.auction_status import AuctionStatus
@@ -21,16 +20,25 @@ class Player(Base):
     is_bowler = Column(Boolean, default=False)
     batting_style = Column(Enum(BattingStyle), nullable=True)
     bowling_style = Column(Enum(BowlingStyle), nullable=True)
-    player_role = Column(Enum(PlayerRole), nullable=False)  # Auto-calculated based on skills
+    player_role = Column(Enum(PlayerRole), nullable=False)  # Derived from the skill flags on every write
     
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
 
     # Relationships
     player_seasons = relationship("PlayerSeason", back_populates="player")
 
 
+@event.listens_for(Player, "before_insert")
+@event.listens_for(Player, "before_update")
+def _sync_player_role(mapper, connection, target: Player) -> None:
+    """Keep player_role consistent with the skill flags however the row was changed."""
+    target.player_role = PlayerRole.from_skills(
+        bool(target.is_wicketkeeper), bool(target.is_batsman), bool(target.is_bowler)
+    )
+
+
 class PlayerSeason(Base):
     __tablename__ = "player_seasons"
 
@@ -39,18 +47,23 @@ class PlayerSeason(Base):
     season_id = Column(Integer, ForeignKey("seasons.id"), nullable=False)
     
     # Season-specific data
-    registered_at = Column(DateTime, default=datetime.now())
+    registered_at = Column(DateTime, server_default=func.now())
     is_selected_for_auction = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
     
     # Auction status tracking
     auction_status = Column(Enum(AuctionStatus), default=AuctionStatus.PENDING)
     auction_round = Column(Integer, default=1)  # Track which auction round
     
-    # Unique constraint to prevent duplicate registrations
-    __table_args__ = (UniqueConstraint('player_id', 'season_id', name='unique_player_season'),)
+    # Unique constraint to prevent duplicate registrations (also serves
+    # player_id + season_id lookups); the index backs the per-season
+    # status/round filters used by the auction flow
+    __table_args__ = (
+        UniqueConstraint('player_id', 'season_id', name='unique_player_season'),
+        Index('ix_player_seasons_season_status_round', 'season_id', 'auction_status', 'auction_round'),
+    )
 
     # Relationships
     player = relationship("Player", back_populates="player_seasons")
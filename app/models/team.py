@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Numeric, UniqueConstraint
+from sqlalchemy import func, Column, Integer, String, DateTime, ForeignKey, Boolean, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.db.base import Base
 
 class Team(Base):
@@ -10,8 +9,8 @@ class Team(Base):
     name = Column(String(255), nullable=False)
     logo_url = Column(String(500), nullable=True)
     owner_name = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
 
     # Relationships
@@ -32,11 +31,17 @@ class TeamSeason(Base):
     max_players = Column(Integer, nullable=False)  # Maximum players allowed in team
     current_players = Column(Integer, default=0)  # Current number of players in team
     
-    created_at = Column(DateTime, default=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
     is_active = Column(Boolean, default=True)
     
-    # Unique constraint to prevent duplicate team registrations in same season
-    __table_args__ = (UniqueConstraint('team_id', 'season_id', name='unique_team_season'),)
+    # Unique constraint to prevent duplicate team registrations in same season;
+    # the indexes back season-wide listings, icon player lookups and the
+    # active-team scans behind bidding and the max-bid aggregate
+    __table_args__ = (
+        UniqueConstraint('team_id', 'season_id', name='unique_team_season'),
+        Index('ix_team_seasons_season_icon_player', 'season_id', 'icon_player_id'),
+        Index('ix_team_seasons_season_active', 'season_id', 'is_active'),
+    )
 
     # Relationships
     team = relationship("Team", back_populates="team_seasons")
@@ -53,7 +58,7 @@ class PlayerPurchase(Base):
     player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
     purchase_price = Column(Numeric(15, 2), nullable=False)  # Price paid for the player
     is_icon_player = Column(Boolean, default=False)  # True if this is the icon player (free)
-    purchased_at = Column(DateTime, default=datetime.now())
+    purchased_at = Column(DateTime, server_default=func.now())
     is_active = Column(Boolean, default=True)
     
     # Unique constraint to prevent same player being bought by multiple teams in same season
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, LargeBinary, DateTime, ForeignKey, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -6,7 +7,14 @@ class Token(Base):
     __tablename__ = "tokens"
 
     id = Column(Integer, primary_key=True, index=True)
-    refresh_token = Column(String(255), unique=True, index=True, nullable=False)
+    # SHA-256 of the refresh token; the raw JWT is never stored. MySQL can't
+    # index a BLOB without a prefix length, so use fixed-width BINARY there.
+    refresh_token_hash = Column(
+        LargeBinary(32).with_variant(mysql.BINARY(32), "mysql"), unique=True, index=True, nullable=False
+    )
     expires_at = Column(DateTime, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    user = relationship("User", back_populates="tokens")
\ No newline at end of file
+    user = relationship("User", back_populates="tokens")
+
+    # Backs range scans over expired tokens during cleanup
+    __table_args__ = (Index("ix_token_expires_at", "expires_at"),)
\ No newline at end of file
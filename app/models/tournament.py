@@ -1,7 +1,5 @@
-from unicodedata import category
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Numeric
+from sqlalchemy import func, Column, Integer, String, DateTime, ForeignKey, Boolean, Enum, Numeric
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.db.base import Base
 from app.enums import TournamentCategory, AuctionMode
 
@@ -14,8 +12,8 @@ class Tournament(Base):
     logo_key = Column(String(500), nullable=True)
     category = Column(Enum(TournamentCategory), nullable=False, default=TournamentCategory.OTHER)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_active = Column(Boolean, default=True)
 
     # Relationships
@@ -30,8 +28,8 @@ class Season(Base):
     year = Column(Integer, nullable=False)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     registration_open = Column(Boolean, default=True)
     is_active = Column(Boolean, default=True)
     
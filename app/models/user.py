@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Enum, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from app.enums.role import Role
@@ -19,6 +19,9 @@ class User(Base):
     auction_limit = Column(Integer, default=0, nullable=False)
     auctions_created = Column(Integer, default=0, nullable=False)
     is_verified = Column(Boolean, default=False)
+
+    # Backs the superadmin listings filtered by approval status and role
+    __table_args__ = (Index('ix_users_is_approved_role', 'is_approved', 'role'),)
     
     # --- Relationships ---
     tokens = relationship("Token", back_populates="user", cascade="all, delete-orphan")
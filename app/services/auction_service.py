@@ -4,23 +4,62 @@ Auction service for Cricket Auction API.
 Handles auction management and bidding business logic.
 """
 
-from typing import List
-import random
+from typing import List, Union
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 from app.models import User
 from app.models.player import PlayerSeason as PlayerSeasonModel
 from app.models.team import TeamSeason as TeamSeasonModel
 from app.dto.auction_dto import (
     AuctionStart, PlayerBid, ManualPlayerSelect, FastAssignment,
-    AuctionPlayerResponse
+    AuctionPlayerResponse, AuctionActionRequired
 )
 from app.managers.validation_manager import ValidationManager
 from app.managers.auction_manager import AuctionManager
 from app.managers.data_manager import DataManager
 from app.utils.serializers import PlayerSerializer
 from app.enums.auction_status import AuctionStatus
+from app.db.loading import strict_loading
+
+
+# Statements on the live-auction paths are built once at import and run with
+# bound parameters, so each request skips constructing them and always hits
+# the engine's compiled-statement cache.
+def _next_pending_id(random_order) -> Select:
+    """One random pending player id for a season's current round."""
+    return select(PlayerSeasonModel.id).where(
+        PlayerSeasonModel.season_id == bindparam("season_id"),
+        PlayerSeasonModel.auction_status == AuctionStatus.PENDING,
+        PlayerSeasonModel.auction_round == bindparam("auction_round")
+    ).order_by(random_order).limit(1)
+
+# MySQL spells the random function RAND
+_NEXT_PENDING_ID = {"mysql": _next_pending_id(func.rand())}
+_NEXT_PENDING_ID_DEFAULT = _next_pending_id(func.random())
+
+_HAS_UNSOLD = select(PlayerSeasonModel.id).where(
+    PlayerSeasonModel.season_id == bindparam("season_id"),
+    PlayerSeasonModel.auction_status == AuctionStatus.UNSOLD
+).limit(1)
+
+_PENDING_PLAYER = select(PlayerSeasonModel).where(
+    PlayerSeasonModel.season_id == bindparam("season_id"),
+    PlayerSeasonModel.player_id == bindparam("player_id"),
+    PlayerSeasonModel.auction_status == AuctionStatus.PENDING
+)
+_PENDING_PLAYER_WITH_PROFILE = _PENDING_PLAYER.options(
+    joinedload(PlayerSeasonModel.player, innerjoin=True), *strict_loading()
+)
+_LOCK_PENDING_PLAYER = _PENDING_PLAYER.with_for_update()
+
+_LOCK_TEAM_WITH_NAME = select(TeamSeasonModel).options(
+    joinedload(TeamSeasonModel.team, innerjoin=True), *strict_loading()
+).where(
+    TeamSeasonModel.team_id == bindparam("team_id"),
+    TeamSeasonModel.season_id == bindparam("season_id")
+).with_for_update(of=TeamSeasonModel)
 
 
 class AuctionService:
@@ -85,41 +124,41 @@ class AuctionService:
         }
 
     @staticmethod
-    def get_next_auction_player(season_id: int, current_user: User, db: Session) -> AuctionPlayerResponse:
+    def get_next_auction_player(season_id: int, current_user: User, db: Session) -> Union[AuctionPlayerResponse, AuctionActionRequired]:
         """
         Get next random player for auction (RANDOM mode).
         """
         # Verify season belongs to organizer
-        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        season = ValidationManager.validate_season_settings(db, season_id, current_user)
         ValidationManager.validate_auction_started(season)
         
-        # Get pending players for current round
-        pending_players = db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.auction_status == AuctionStatus.PENDING,
-            PlayerSeasonModel.auction_round == season.current_auction_round
-        ).all()
+        # Let the database pick one pending player for the current round
+        # instead of loading the whole pool to choose from in Python. Only
+        # ids go through the random sort; the chosen row is loaded after.
+        next_pending_id = _NEXT_PENDING_ID.get(db.get_bind().dialect.name, _NEXT_PENDING_ID_DEFAULT)
+        selected_id = db.execute(
+            next_pending_id, {"season_id": season_id, "auction_round": season.current_auction_round}
+        ).scalar()
         
-        if not pending_players:
+        if selected_id is None:
             # Check if there are unsold players from previous rounds
-            unsold_players = db.query(PlayerSeasonModel).filter(
-                PlayerSeasonModel.season_id == season_id,
-                PlayerSeasonModel.auction_status == AuctionStatus.UNSOLD
-            ).all()
+            has_unsold_players = db.execute(_HAS_UNSOLD, {"season_id": season_id}).scalar() is not None
             
-            if unsold_players:
-                return {
-                    "message": "No pending players. Start next round with unsold players?",
-                    "action_required": "start_next_round"
-                }
+            if has_unsold_players:
+                return AuctionActionRequired(
+                    message="No pending players. Start next round with unsold players?",
+                    action_required="start_next_round"
+                )
             else:
-                return {
-                    "message": "Auction completed! All players have been processed.",
-                    "action_required": "auction_complete"
-                }
+                return AuctionActionRequired(
+                    message="Auction completed! All players have been processed.",
+                    action_required="auction_complete"
+                )
         
-        # Randomly select a player
-        selected_player = random.choice(pending_players)
+        selected_player = db.get(
+            PlayerSeasonModel, selected_id,
+            options=[joinedload(PlayerSeasonModel.player, innerjoin=True), *strict_loading()]
+        )
         
         # Calculate maximum bid allowed for each team
         max_bid = AuctionManager.calculate_max_bid_for_player(db, season_id, season.base_price, season.max_players_per_team)
@@ -141,15 +180,14 @@ class AuctionService:
         Get specific player for auction (MANUAL mode).
         """
         # Verify season belongs to organizer
-        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        season = ValidationManager.validate_season_settings(db, season_id, current_user)
         ValidationManager.validate_auction_started(season)
         
-        # Get the specific player
-        player_season = db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.player_id == player_select.player_id,
-            PlayerSeasonModel.auction_status == AuctionStatus.PENDING
-        ).first()
+        # Get the specific player together with the profile the response needs
+        player_season = db.execute(
+            _PENDING_PLAYER_WITH_PROFILE,
+            {"season_id": season_id, "player_id": player_select.player_id}
+        ).scalar_one_or_none()
         
         if not player_season:
             raise HTTPException(status_code=404, detail="Player not found or not available for auction")
@@ -173,15 +211,14 @@ class AuctionService:
         Process player bid - either sell to team or mark as unsold.
         """
         # Verify season belongs to organizer
-        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        season = ValidationManager.validate_season_settings(db, season_id, current_user)
         ValidationManager.validate_auction_started(season)
         
-        # Get player season record
-        player_season = db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.player_id == bid_data.player_id,
-            PlayerSeasonModel.auction_status == AuctionStatus.PENDING
-        ).first()
+        # Lock the player's row so concurrent bids on the same player are
+        # applied one at a time; a bid that waited sees the updated status.
+        player_season = db.execute(
+            _LOCK_PENDING_PLAYER, {"season_id": season_id, "player_id": bid_data.player_id}
+        ).scalar_one_or_none()
         
         if not player_season:
             raise HTTPException(status_code=404, detail="Player not found or not available for bidding")
@@ -194,11 +231,11 @@ class AuctionService:
                     detail=f"Bid amount must be at least base price of {season.base_price}"
                 )
             
-            # Get team season record
-            team_season = db.query(TeamSeasonModel).filter(
-                TeamSeasonModel.team_id == bid_data.team_id,
-                TeamSeasonModel.season_id == season_id
-            ).first()
+            # Lock the team's row too so its budget can't change under this bid.
+            # The team name for the message comes back in the same query.
+            team_season = db.execute(
+                _LOCK_TEAM_WITH_NAME, {"season_id": season_id, "team_id": bid_data.team_id}
+            ).scalar_one_or_none()
             
             if not team_season:
                 raise HTTPException(status_code=404, detail="Team not found in this season")
@@ -209,7 +246,7 @@ class AuctionService:
                 raise HTTPException(status_code=400, detail=validation["reason"])
             
             # Create player purchase record and update team
-            DataManager.create_player_purchase(db, team_season, bid_data.player_id, bid_data.bid_amount)
+            DataManager.record_player_sale(db, team_season, bid_data.player_id, bid_data.bid_amount)
             
             # Update player status
             player_season.auction_status = AuctionStatus.SOLD
@@ -231,42 +268,64 @@ class AuctionService:
         Fast assign multiple players to teams without bidding process.
         """
         # Verify season belongs to organizer
-        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        season = ValidationManager.validate_season_settings(db, season_id, current_user)
         ValidationManager.validate_auction_started(season)
         
-        assigned_count = 0
-        
-        for assignment in assignments:
-            # Get player season record
-            player_season = db.query(PlayerSeasonModel).filter(
+        # Prefetch every player and team the batch refers to with one IN query each
+        player_seasons = {
+            player_season.player_id: player_season
+            for player_season in db.query(PlayerSeasonModel).options(*strict_loading()).filter(
                 PlayerSeasonModel.season_id == season_id,
-                PlayerSeasonModel.player_id == assignment.player_id,
+                PlayerSeasonModel.player_id.in_({assignment.player_id for assignment in assignments}),
                 PlayerSeasonModel.auction_status.in_([AuctionStatus.PENDING, AuctionStatus.UNSOLD])
-            ).first()
-            
+            )
+        }
+        # Lock the teams whose budgets this batch may change, as bid_on_player does
+        team_seasons = {
+            team_season.team_id: team_season
+            for team_season in db.query(TeamSeasonModel).options(*strict_loading()).filter(
+                TeamSeasonModel.season_id == season_id,
+                TeamSeasonModel.team_id.in_({assignment.team_id for assignment in assignments})
+            ).with_for_update()
+        }
+        
+        sold_ids = []
+        purchases = []
+        for assignment in assignments:
+            player_season = player_seasons.get(assignment.player_id)
             if not player_season:
                 continue  # Skip if player not available
             
-            # Get team season record
-            team_season = db.query(TeamSeasonModel).filter(
-                TeamSeasonModel.team_id == assignment.team_id,
-                TeamSeasonModel.season_id == season_id
-            ).first()
-            
+            team_season = team_seasons.get(assignment.team_id)
             if not team_season:
                 continue  # Skip if team not found
             
-            # Validate budget and player limits
+            # Validate budget and player limits against the running totals
             validation = AuctionManager.validate_team_budget(db, team_season, assignment.price, season.base_price)
             if not validation["can_bid"]:
                 continue  # Skip if budget validation fails
             
-            # Create player purchase record and update team
-            DataManager.create_player_purchase(db, team_season, assignment.player_id, assignment.price)
+            # Charge the team now so later assignments see the running totals
+            DataManager.charge_team(team_season, assignment.price)
+            purchases.append({
+                "team_season_id": team_season.id,
+                "player_id": assignment.player_id,
+                "purchase_price": assignment.price,
+                "is_icon_player": False
+            })
             
-            # Update player status
-            player_season.auction_status = AuctionStatus.SOLD
-            assigned_count += 1
+            # A player can only be sold once per batch
+            del player_seasons[assignment.player_id]
+            sold_ids.append(player_season.id)
+        
+        assigned_count = len(sold_ids)
+        if sold_ids:
+            # Insert every purchase and mark every sold player with one
+            # statement each; team totals are written as a batch on commit
+            DataManager.create_player_purchases(db, purchases)
+            db.query(PlayerSeasonModel).filter(
+                PlayerSeasonModel.id.in_(sold_ids)
+            ).update({"auction_status": AuctionStatus.SOLD}, synchronize_session=False)
         
         db.commit()
         
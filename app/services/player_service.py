@@ -4,15 +4,24 @@ Player service for Cricket Auction API.
 Handles player registration and management business logic.
 """
 
-from typing import List
-from datetime import datetime
+from typing import Iterable, List
+from sqlalchemy import and_, case, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.models import User
 from app.models.player import Player as PlayerModel, PlayerSeason as PlayerSeasonModel
 from app.dto.tournament_dto import Player, PlayerCreate, PlayerSeason, PlayerSelectionUpdate
 from app.managers.validation_manager import ValidationManager
-from app.managers.auction_manager import AuctionManager
+
+# Columns of the PlayerSeason DTO, selected directly for the season listing
+_PLAYER_SEASON_COLUMNS = (
+    PlayerSeasonModel.id, PlayerSeasonModel.player_id, PlayerSeasonModel.season_id,
+    PlayerSeasonModel.is_selected_for_auction, PlayerSeasonModel.auction_status,
+    PlayerSeasonModel.auction_round, PlayerSeasonModel.created_at,
+    PlayerSeasonModel.updated_at, PlayerSeasonModel.is_active
+)
 
 
 class PlayerService:
@@ -45,24 +54,26 @@ class PlayerService:
         if not season.registration_open:
             raise HTTPException(status_code=400, detail="Registration is closed for this season")
         
-        # Check if player already registered in this season
-        existing_player_season = db.query(PlayerSeasonModel).join(PlayerModel).filter(
-            PlayerModel.mobile == player_data.mobile,
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.is_active == True
-        ).first()
-        
-        if existing_player_season:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Player with mobile {player_data.mobile} is already registered in this season"
+        # Find the player by mobile together with any active registration
+        # for this season in a single round trip
+        row = db.query(PlayerModel, PlayerSeasonModel).outerjoin(
+            PlayerSeasonModel,
+            and_(
+                PlayerSeasonModel.player_id == PlayerModel.id,
+                PlayerSeasonModel.season_id == season_id,
+                PlayerSeasonModel.is_active == True
             )
+        ).filter(PlayerModel.mobile == player_data.mobile).first()
         
-        # Check if player exists in database
-        existing_player = db.query(PlayerModel).filter(
-            PlayerModel.mobile == player_data.mobile,
-            PlayerModel.is_active == True
-        ).first()
+        duplicate_registration = HTTPException(
+            status_code=400, 
+            detail=f"Player with mobile {player_data.mobile} is already registered in this season"
+        )
+        
+        if row and row[1] is not None:
+            raise duplicate_registration
+        
+        existing_player = row[0] if row and row[0].is_active else None
         
         if existing_player:
             # Update existing player data if needed
@@ -75,21 +86,9 @@ class PlayerService:
             existing_player.is_bowler = player_data.is_bowler
             existing_player.batting_style = player_data.batting_style
             existing_player.bowling_style = player_data.bowling_style
-            existing_player.player_role = AuctionManager.calculate_player_role(
-                player_data.is_wicketkeeper,
-                player_data.is_batsman,
-                player_data.is_bowler
-            )
-            existing_player.updated_at = datetime.now()
             player = existing_player
         else:
-            # Create new player
-            player_role = AuctionManager.calculate_player_role(
-                player_data.is_wicketkeeper,
-                player_data.is_batsman,
-                player_data.is_bowler
-            )
-            
+            # Create new player; player_role is derived from the skill flags on flush
             player = PlayerModel(
                 first_name=player_data.first_name,
                 last_name=player_data.last_name,
@@ -100,8 +99,7 @@ class PlayerService:
                 is_batsman=player_data.is_batsman,
                 is_bowler=player_data.is_bowler,
                 batting_style=player_data.batting_style,
-                bowling_style=player_data.bowling_style,
-                player_role=player_role
+                bowling_style=player_data.bowling_style
             )
             db.add(player)
             db.flush()  # Get player ID
@@ -113,24 +111,31 @@ class PlayerService:
         )
         
         db.add(player_season)
-        db.commit()
-        db.refresh(player_season)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request registered the same player first
+            db.rollback()
+            raise duplicate_registration
         return player_season
 
     @staticmethod
-    def get_season_players(season_id: int, current_user: User, db: Session) -> List[PlayerSeasonModel]:
+    def get_season_players(season_id: int, current_user: User, db: Session) -> Iterable[RowMapping]:
         """
         Get all players registered for a season.
+        Ownership is checked immediately; rows are fetched in batches as the result is iterated.
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        player_seasons = db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.is_active == True
-        ).all()
-        
-        return player_seasons
+        return db.execute(
+            select(*_PLAYER_SEASON_COLUMNS)
+            .where(
+                PlayerSeasonModel.season_id == season_id,
+                PlayerSeasonModel.is_active == True
+            )
+            .execution_options(yield_per=200)
+        ).mappings()
 
     @staticmethod
     def close_player_registration(season_id: int, current_user: User, db: Session) -> dict:
@@ -152,19 +157,18 @@ class PlayerService:
         Select players for auction from registered players.
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        # Reset all players selection status for this season
+        # One set-based UPDATE that only touches rows whose flag actually
+        # changes; nothing loaded in this session needs syncing since only a
+        # message is returned.
+        is_selected = case(
+            (PlayerSeasonModel.player_id.in_(selection_data.player_ids), True), else_=False
+        )
         db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id
-        ).update({"is_selected_for_auction": False})
-        
-        # Select specified players
-        if selection_data.player_ids:
-            db.query(PlayerSeasonModel).filter(
-                PlayerSeasonModel.player_id.in_(selection_data.player_ids),
-                PlayerSeasonModel.season_id == season_id
-            ).update({"is_selected_for_auction": True})
+            PlayerSeasonModel.season_id == season_id,
+            PlayerSeasonModel.is_selected_for_auction.is_distinct_from(is_selected)
+        ).update({"is_selected_for_auction": is_selected}, synchronize_session=False)
         
         db.commit()
         
@@ -6,15 +6,36 @@ Handles team registration and management business logic.
 
 from typing import List
 from decimal import Decimal
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.models import User
 from app.models.team import Team as TeamModel, TeamSeason as TeamSeasonModel
+from app.models.player import PlayerSeason as PlayerSeasonModel
 from app.dto.team_dto import (
     AuctionConfig, AuctionConfigCreate, TeamRegistrationCreate, TeamWithIconPlayer
 )
 from app.managers.validation_manager import ValidationManager
 from app.managers.data_manager import DataManager
+from app.db.loading import strict_loading
+from app.utils.cache import TTLCache
+
+# Auction config can no longer change once the auction has started, so
+# those responses are kept per season. A hit is only served after the
+# (briefly cached) ownership check, so a deleted season stops answering
+# as soon as that check does.
+_started_auction_configs = TTLCache(maxsize=1024, ttl=60)
+
+# Column projections for the season team listing, shaped like the TeamSeason DTO
+_TEAM_SEASON_COLUMNS = (
+    TeamSeasonModel.id, TeamSeasonModel.team_id, TeamSeasonModel.season_id,
+    TeamSeasonModel.icon_player_id, TeamSeasonModel.current_players,
+    TeamSeasonModel.max_players, TeamSeasonModel.created_at, TeamSeasonModel.is_active
+)
+_TEAM_COLUMNS = (
+    TeamModel.id, TeamModel.name, TeamModel.owner_name, TeamModel.logo_url,
+    TeamModel.created_at, TeamModel.updated_at, TeamModel.is_active
+)
 
 
 class TeamService:
@@ -39,7 +60,6 @@ class TeamService:
         season.auction_configured = True
         
         db.commit()
-        db.refresh(season)
         
         return AuctionConfig(
             base_price=season.base_price,
@@ -54,16 +74,24 @@ class TeamService:
         """
         Get auction configuration for a season.
         """
+        cached_config = _started_auction_configs.get(season_id)
+        if cached_config is not None:
+            ValidationManager.ensure_season_ownership(db, season_id, current_user)
+            return cached_config
+
         # Verify season belongs to organizer
-        season = ValidationManager.validate_season_ownership(db, season_id, current_user)
+        season = ValidationManager.validate_season_settings(db, season_id, current_user)
         
-        return AuctionConfig(
+        config = AuctionConfig(
             base_price=season.base_price,
             max_players_per_team=season.max_players_per_team,
             total_budget_per_team=season.total_budget_per_team,
             auction_configured=season.auction_configured,
             auction_started=season.auction_started
         )
+        if season.auction_started:
+            _started_auction_configs.set(season_id, config)
+        return config
 
     @staticmethod
     def register_teams_for_season(season_id: int, team_data: TeamRegistrationCreate, 
@@ -80,72 +108,98 @@ class TeamService:
         if season.auction_started:
             raise HTTPException(status_code=400, detail="Cannot register teams after auction has started")
         
-        created_team_seasons = []
+        # Resolve every team by name in one query
+        team_names = {team_create.name for team_create in team_data.teams}
+        teams_by_name = {
+            team.name: team
+            for team in db.query(TeamModel).filter(TeamModel.name.in_(team_names))
+        }
+        
+        # Existing teams already registered for this season, also in one query
+        registered_team_ids = {
+            team_id for (team_id,) in db.query(TeamSeasonModel.team_id).filter(
+                TeamSeasonModel.season_id == season_id,
+                TeamSeasonModel.team_id.in_([team.id for team in teams_by_name.values()])
+            )
+        } if teams_by_name else set()
         
+        # Report every conflict at once, including names repeated in the request
+        conflicts = []
+        seen_names = set()
         for team_create in team_data.teams:
-            # Check if team already exists
-            existing_team = db.query(TeamModel).filter(
-                TeamModel.name == team_create.name
-            ).first()
-            
-            if existing_team:
-                team = existing_team
-            else:
-                # Create new team
+            team = teams_by_name.get(team_create.name)
+            if team_create.name in seen_names or (team is not None and team.id in registered_team_ids):
+                if team_create.name not in conflicts:
+                    conflicts.append(team_create.name)
+            seen_names.add(team_create.name)
+        
+        if conflicts:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Teams already registered for this season: {', '.join(conflicts)}"
+            )
+        
+        new_teams = []
+        for team_create in team_data.teams:
+            if team_create.name not in teams_by_name:
                 team = TeamModel(
                     name=team_create.name,
                     logo_url=team_create.logo_url,
                     owner_name=team_create.owner_name
                 )
-                db.add(team)
-                db.flush()  # Get team ID
-            
-            # Check if team already registered for this season
-            existing_team_season = db.query(TeamSeasonModel).filter(
-                TeamSeasonModel.team_id == team.id,
-                TeamSeasonModel.season_id == season_id
-            ).first()
-            
-            if existing_team_season:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Team '{team.name}' is already registered for this season"
-                )
-            
-            # Create team-season relationship
-            team_season = TeamSeasonModel(
-                team_id=team.id,
+                teams_by_name[team_create.name] = team
+                new_teams.append(team)
+        
+        if new_teams:
+            db.add_all(new_teams)
+            db.flush()  # One batched INSERT for all new teams; assigns their IDs
+        
+        created_team_seasons = [
+            TeamSeasonModel(
+                team_id=teams_by_name[team_create.name].id,
                 season_id=season_id,
                 total_budget=season.total_budget_per_team,
                 remaining_budget=season.total_budget_per_team,
                 max_players=season.max_players_per_team
             )
-            
-            db.add(team_season)
-            created_team_seasons.append(team_season)
+            for team_create in team_data.teams
+        ]
         
+        db.add_all(created_team_seasons)
         db.commit()
         
-        # Refresh all created team seasons
-        for team_season in created_team_seasons:
-            db.refresh(team_season)
-        
         return created_team_seasons
 
     @staticmethod
-    def get_season_teams(season_id: int, current_user: User, db: Session) -> List[TeamSeasonModel]:
+    def get_season_teams(season_id: int, current_user: User, db: Session) -> List[dict]:
         """
         Get all teams registered for a season.
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        team_seasons = db.query(TeamSeasonModel).filter(
-            TeamSeasonModel.season_id == season_id,
-            TeamSeasonModel.is_active == True
-        ).all()
+        # TeamSeason responses embed the team; select its columns in the same query
+        rows = db.execute(
+            select(
+                *_TEAM_SEASON_COLUMNS, TeamSeasonModel.remaining_budget,
+                TeamSeasonModel.total_budget, *_TEAM_COLUMNS
+            )
+            .join(TeamModel, TeamSeasonModel.team_id == TeamModel.id)
+            .where(
+                TeamSeasonModel.season_id == season_id,
+                TeamSeasonModel.is_active == True
+            )
+        ).mappings()
         
-        return team_seasons
+        return [
+            {
+                **{column.key: row[column] for column in _TEAM_SEASON_COLUMNS},
+                "remaining_budget": float(row[TeamSeasonModel.remaining_budget]),
+                "total_budget": float(row[TeamSeasonModel.total_budget]),
+                "team": {column.key: row[column] for column in _TEAM_COLUMNS}
+            }
+            for row in rows
+        ]
 
     @staticmethod
     def assign_icon_players(season_id: int, assignments: List[TeamWithIconPlayer], 
@@ -159,14 +213,39 @@ class TeamService:
         if season.auction_started:
             raise HTTPException(status_code=400, detail="Cannot assign icon players after auction has started")
         
+        team_ids = {assignment.team_id for assignment in assignments}
+        player_ids = {assignment.icon_player_id for assignment in assignments}
+        
+        # Fetch the whole working set up front: the teams being assigned,
+        # which requested players are selected for auction, and which
+        # already hold an icon slot in this season
+        team_seasons = {
+            team_season.team_id: team_season
+            for team_season in db.query(TeamSeasonModel).options(*strict_loading()).filter(
+                TeamSeasonModel.season_id == season_id,
+                TeamSeasonModel.team_id.in_(team_ids)
+            )
+        }
+        selected_player_ids = {
+            player_id for (player_id,) in db.query(PlayerSeasonModel.player_id).filter(
+                PlayerSeasonModel.season_id == season_id,
+                PlayerSeasonModel.player_id.in_(player_ids),
+                PlayerSeasonModel.is_selected_for_auction == True
+            )
+        }
+        icon_player_ids = {
+            icon_player_id for (icon_player_id,) in db.query(TeamSeasonModel.icon_player_id).filter(
+                TeamSeasonModel.season_id == season_id,
+                TeamSeasonModel.icon_player_id.in_(player_ids)
+            )
+        }
+        
         assigned_players = []
+        purchases = []
         
         for assignment in assignments:
             # Verify team exists in this season
-            team_season = db.query(TeamSeasonModel).filter(
-                TeamSeasonModel.team_id == assignment.team_id,
-                TeamSeasonModel.season_id == season_id
-            ).first()
+            team_season = team_seasons.get(assignment.team_id)
             
             if not team_season:
                 raise HTTPException(
@@ -175,26 +254,14 @@ class TeamService:
                 )
             
             # Verify player is selected for auction
-            from app.models.player import PlayerSeason as PlayerSeasonModel
-            player_season = db.query(PlayerSeasonModel).filter(
-                PlayerSeasonModel.player_id == assignment.icon_player_id,
-                PlayerSeasonModel.season_id == season_id,
-                PlayerSeasonModel.is_selected_for_auction == True
-            ).first()
-            
-            if not player_season:
+            if assignment.icon_player_id not in selected_player_ids:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Player ID {assignment.icon_player_id} not found or not selected for auction"
                 )
             
             # Check if player is already assigned as icon player
-            existing_assignment = db.query(TeamSeasonModel).filter(
-                TeamSeasonModel.icon_player_id == assignment.icon_player_id,
-                TeamSeasonModel.season_id == season_id
-            ).first()
-            
-            if existing_assignment:
+            if assignment.icon_player_id in icon_player_ids:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Player ID {assignment.icon_player_id} is already assigned as icon player"
@@ -202,12 +269,22 @@ class TeamService:
             
             # Assign icon player
             team_season.icon_player_id = assignment.icon_player_id
+            icon_player_ids.add(assignment.icon_player_id)
             team_season.current_players = 1  # Icon player counts as 1 player
             
-            # Create player purchase record
-            DataManager.create_player_purchase(db, team_season, assignment.icon_player_id, Decimal('0'), is_icon_player=True)
+            # Record the free icon purchase
+            DataManager.charge_team(team_season, Decimal('0'))
+            purchases.append({
+                "team_season_id": team_season.id,
+                "player_id": assignment.icon_player_id,
+                "purchase_price": Decimal('0'),
+                "is_icon_player": True
+            })
             assigned_players.append(assignment.icon_player_id)
         
+        # Nothing has been written yet; the purchase rows go out as one
+        # executemany INSERT and the team updates as one batch on commit
+        DataManager.create_player_purchases(db, purchases)
         db.commit()
         
         return {
@@ -5,14 +5,47 @@ Handles tournament and season management business logic.
 """
 
 from typing import List
+from sqlalchemy import null, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.models import User
 from app.models.tournament import Tournament as TournamentModel, Season as SeasonModel
+from app.enums import TournamentCategory
 from app.dto.tournament_dto import TournamentResponse, TournamentCreate, Season, SeasonCreate
 from app.managers.validation_manager import ValidationManager
-from app.utils.s3_helper import S3Helper
-from pydantic import model_validator
+from app.managers.data_manager import DataManager
+from app.utils.s3_helper import s3_helper
+from app.utils.serializers import construct_from_orm
+
+# Column projections for the read-only list endpoints; rows are returned as
+# plain dicts shaped like the Season / TournamentResponse DTOs.
+_TOURNAMENT_COLUMNS = (
+    TournamentModel.id, TournamentModel.name, TournamentModel.description,
+    TournamentModel.category, TournamentModel.created_by, TournamentModel.created_at,
+    TournamentModel.updated_at, TournamentModel.is_active, null().label("logo")
+)
+_SEASON_COLUMNS = (
+    SeasonModel.id, SeasonModel.name, SeasonModel.year, SeasonModel.tournament_id,
+    SeasonModel.created_by, SeasonModel.created_at, SeasonModel.registration_open,
+    SeasonModel.is_active
+)
+
+
+def _season_rows(db: Session, *criteria) -> List[dict]:
+    """Fetches seasons with their tournament in one query, latest first."""
+    rows = db.execute(
+        select(*_SEASON_COLUMNS, *_TOURNAMENT_COLUMNS)
+        .join(TournamentModel, SeasonModel.tournament_id == TournamentModel.id)
+        .where(*criteria)
+        .order_by(SeasonModel.created_at.desc())
+    ).mappings()
+    return [
+        {
+            **{column.key: row[column] for column in _SEASON_COLUMNS},
+            "tournament": {column.key: row[column] for column in _TOURNAMENT_COLUMNS}
+        }
+        for row in rows
+    ]
 
 
 class TournamentService:
@@ -24,43 +57,54 @@ class TournamentService:
         Create a new tournament. No credit limit - organizers can create unlimited tournaments.
         """
         # Check if tournament with same name already exists for this organizer
-        existing_tournament = db.query(TournamentModel).filter(
+        tournament_exists = db.query(db.query(TournamentModel).filter(
             TournamentModel.name == tournament_data.name,
             TournamentModel.created_by == current_user.id,
             TournamentModel.is_active == True
-        ).first()
+        ).exists()).scalar()
         
-        
-        if existing_tournament:
+        if tournament_exists:
             raise HTTPException(
                 status_code=400,
                 detail=f"Tournament with name '{tournament_data.name}' already exists"
             )
 
-        logo_key = S3Helper().extract_file_key_from_url(tournament_data.logo)
+        # Reuse the shared helper; building a boto3 client per request is slow
+        logo_key = s3_helper.extract_file_key_from_url(tournament_data.logo)
+        # Requests may name the category by member or value. Store the member
+        # so the response carries its value, as the reloaded row used to.
+        category = (
+            TournamentCategory.__members__.get(tournament_data.category)
+            or TournamentCategory(tournament_data.category)
+        )
         new_tournament = TournamentModel(
             name=tournament_data.name,
             description=tournament_data.description,
             logo_key=logo_key,
-            category=tournament_data.category,
+            category=category,
             created_by=current_user.id
         )
         db.add(new_tournament)
         db.commit()
-        db.refresh(new_tournament)
-        return TournamentResponse.model_validate(new_tournament)
+        return construct_from_orm(TournamentResponse, new_tournament)
 
     @staticmethod
     def create_season(tournament_id: int, season_data: SeasonCreate, current_user: User, db: Session) -> SeasonModel:
         """
         Create a new season under an existing tournament. Uses 1 auction credit.
         """
-        # Check if organizer has credits
-        ValidationManager.validate_auction_credits(current_user)
-        
         # Verify tournament belongs to organizer
         tournament = ValidationManager.validate_tournament_ownership(db, tournament_id, current_user)
         
+        # Deduct credit
+        if not DataManager.consume_auction_credit(db, current_user.id):
+            # Re-read the counters so the error reports the current numbers
+            db.refresh(current_user, ["auction_limit", "auctions_created"])
+            ValidationManager.validate_auction_credits(current_user)
+            raise HTTPException(status_code=409, detail="Auction credits changed, please try again")
+        # The increment happened in SQL; reload the counter if it is read again
+        db.expire(current_user, ["auctions_created"])
+        
         # Create season
         new_season = SeasonModel(
             name=season_data.name,
@@ -70,44 +114,37 @@ class TournamentService:
         )
         db.add(new_season)
         
-        # Deduct credit
-        current_user.auctions_created += 1
-        
         db.commit()
-        db.refresh(new_season)
         return new_season
 
     @staticmethod
-    def get_tournament_seasons(tournament_id: int, current_user: User, db: Session) -> List[SeasonModel]:
+    def get_tournament_seasons(tournament_id: int, current_user: User, db: Session) -> List[dict]:
         """
         Get all seasons for a specific tournament, ordered by latest first.
         """
         # Verify tournament belongs to organizer
-        tournament = ValidationManager.validate_tournament_ownership(db, tournament_id, current_user)
+        ValidationManager.validate_tournament_ownership(db, tournament_id, current_user)
         
-        seasons = db.query(SeasonModel).filter(
-            SeasonModel.tournament_id == tournament_id
-        ).order_by(SeasonModel.created_at.desc()).all()
-        return seasons
+        return _season_rows(db, SeasonModel.tournament_id == tournament_id)
 
     @staticmethod
-    def get_my_seasons(current_user: User, db: Session) -> List[SeasonModel]:
+    def get_my_seasons(current_user: User, db: Session) -> List[dict]:
         """
         Get all seasons created by the current organizer, ordered by latest first.
         """
-        seasons = db.query(SeasonModel).filter(
-            SeasonModel.created_by == current_user.id
-        ).order_by(SeasonModel.created_at.desc()).all()
-        return seasons
+        return _season_rows(db, SeasonModel.created_by == current_user.id)
 
     @staticmethod
-    def get_my_tournaments(current_user: User, db: Session) -> List[TournamentModel]:
+    def get_my_tournaments(current_user: User, db: Session) -> List[dict]:
         """
         Get all tournaments created by the current organizer, ordered by latest first.
         """
-        tournaments = db.query(TournamentModel).filter(
-            TournamentModel.created_by == current_user.id
-        ).order_by(TournamentModel.created_at.desc()).all()
+        rows = db.execute(
+            select(*_TOURNAMENT_COLUMNS)
+            .where(TournamentModel.created_by == current_user.id)
+            .order_by(TournamentModel.created_at.desc())
+        ).mappings()
+        tournaments = [dict(row) for row in rows]
 
         # tournaments.logo_key = S3Helper().get_file_url(tournaments.logo_key)
         return tournaments
@@ -4,14 +4,81 @@ Tracking service for Cricket Auction API.
 Handles team tracking and reporting business logic.
 """
 
-from typing import List
-from sqlalchemy.orm import Session
+from typing import Iterable, List
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 from app.models import User
 from app.models.player import Player as PlayerModel, PlayerSeason as PlayerSeasonModel
-from app.models.team import TeamSeason as TeamSeasonModel, PlayerPurchase as PlayerPurchaseModel
-from app.dto.auction_dto import TeamOverview, TeamDetails, AuctionPlayersList
+from app.models.team import Team as TeamModel, TeamSeason as TeamSeasonModel, PlayerPurchase as PlayerPurchaseModel
+from app.dto.auction_dto import TeamOverview, TeamDetails, AuctionPlayersList, SeasonSummary
 from app.managers.validation_manager import ValidationManager
+from app.db.loading import strict_loading
+
+# Every TeamOverview field as one flat row: the team joined in, the icon
+# player's name built by the database (NULL when the team has none)
+_TEAMS_OVERVIEW = select(
+    TeamSeasonModel.team_id,
+    TeamModel.name.label("team_name"),
+    TeamModel.owner_name,
+    TeamModel.logo_url,
+    TeamSeasonModel.current_players,
+    TeamSeasonModel.max_players,
+    TeamSeasonModel.remaining_budget,
+    TeamSeasonModel.total_budget,
+    (PlayerModel.first_name + " " + PlayerModel.last_name).label("icon_player_name"),
+).join(TeamModel, TeamModel.id == TeamSeasonModel.team_id).outerjoin(
+    PlayerModel, PlayerModel.id == TeamSeasonModel.icon_player_id
+).where(
+    TeamSeasonModel.season_id == bindparam("season_id"),
+    TeamSeasonModel.is_active == True
+)
+
+# Team details statements, built once and run with bound parameters
+_TEAM_SEASON_WITH_TEAM = select(TeamSeasonModel).options(
+    joinedload(TeamSeasonModel.team, innerjoin=True), *strict_loading()
+).where(
+    TeamSeasonModel.team_id == bindparam("team_id"),
+    TeamSeasonModel.season_id == bindparam("season_id")
+)
+# Exactly the columns of each roster entry, in response order
+_TEAM_PURCHASES = select(
+    PlayerModel.id,
+    PlayerModel.first_name,
+    PlayerModel.last_name,
+    PlayerModel.village,
+    PlayerModel.mobile,
+    PlayerModel.player_role,
+    PlayerModel.batting_style,
+    PlayerModel.bowling_style,
+    PlayerModel.photo_url,
+    PlayerPurchaseModel.purchase_price,
+    PlayerPurchaseModel.is_icon_player,
+    PlayerPurchaseModel.purchased_at,
+).join(PlayerModel, PlayerModel.id == PlayerPurchaseModel.player_id).where(
+    PlayerPurchaseModel.team_season_id == bindparam("team_season_id"),
+    PlayerPurchaseModel.is_active == True
+)
+# Columns of the AuctionPlayersList DTO for every player selected in a season.
+# yield_per streams the rows (server-side cursor where the driver has one)
+# instead of materializing the whole roster.
+_AUCTION_PLAYERS = select(
+    PlayerModel.id.label("player_id"),
+    PlayerModel.first_name,
+    PlayerModel.last_name,
+    PlayerModel.village,
+    PlayerModel.mobile,
+    PlayerModel.player_role,
+    PlayerModel.batting_style,
+    PlayerModel.bowling_style,
+    PlayerSeasonModel.auction_status,
+    PlayerSeasonModel.auction_round,
+).join(PlayerModel, PlayerModel.id == PlayerSeasonModel.player_id).where(
+    PlayerSeasonModel.season_id == bindparam("season_id"),
+    PlayerSeasonModel.is_selected_for_auction == True,
+    PlayerSeasonModel.is_active == True
+).execution_options(yield_per=200)
 
 
 class TrackingService:
@@ -23,34 +90,12 @@ class TrackingService:
         Get overview of all teams in season (players count, budget, etc.).
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        team_seasons = db.query(TeamSeasonModel).filter(
-            TeamSeasonModel.season_id == season_id,
-            TeamSeasonModel.is_active == True
-        ).all()
+        rows = db.execute(_TEAMS_OVERVIEW, {"season_id": season_id}).mappings()
         
-        teams_overview = []
-        for team_season in team_seasons:
-            icon_player_name = None
-            if team_season.icon_player_id:
-                icon_player = db.query(PlayerModel).filter(
-                    PlayerModel.id == team_season.icon_player_id
-                ).first()
-                if icon_player:
-                    icon_player_name = f"{icon_player.first_name} {icon_player.last_name}"
-            
-            teams_overview.append(TeamOverview(
-                team_id=team_season.team_id,
-                team_name=team_season.team.name,
-                owner_name=team_season.team.owner_name,
-                logo_url=team_season.team.logo_url,
-                current_players=team_season.current_players,
-                max_players=team_season.max_players,
-                remaining_budget=team_season.remaining_budget,
-                total_budget=team_season.total_budget,
-                icon_player_name=icon_player_name
-            ))
+        # Values come straight from typed columns, so skip field validation
+        teams_overview = [TeamOverview.model_construct(**row) for row in rows]
         
         return teams_overview
 
@@ -60,40 +105,29 @@ class TrackingService:
         Get detailed view of a specific team (all players list).
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        # Get team season record
-        team_season = db.query(TeamSeasonModel).filter(
-            TeamSeasonModel.team_id == team_id,
-            TeamSeasonModel.season_id == season_id
-        ).first()
+        # Get team season record along with the team it describes
+        team_season = db.execute(
+            _TEAM_SEASON_WITH_TEAM, {"season_id": season_id, "team_id": team_id}
+        ).scalar_one_or_none()
         
         if not team_season:
             raise HTTPException(status_code=404, detail="Team not found in this season")
         
         # Get all players purchased by this team
-        player_purchases = db.query(PlayerPurchaseModel).filter(
-            PlayerPurchaseModel.team_season_id == team_season.id,
-            PlayerPurchaseModel.is_active == True
-        ).all()
+        player_purchases = db.execute(
+            _TEAM_PURCHASES, {"team_season_id": team_season.id}
+        ).mappings()
         
         players_list = []
         for purchase in player_purchases:
-            player = purchase.player
-            players_list.append({
-                "id": player.id,
-                "first_name": player.first_name,
-                "last_name": player.last_name,
-                "village": player.village,
-                "mobile": player.mobile,
-                "player_role": player.player_role.value,
-                "batting_style": player.batting_style.value if player.batting_style else None,
-                "bowling_style": player.bowling_style.value if player.bowling_style else None,
-                "photo_url": player.photo_url,
-                "purchase_price": float(purchase.purchase_price),
-                "is_icon_player": purchase.is_icon_player,
-                "purchased_at": purchase.purchased_at
-            })
+            player = dict(purchase)
+            player["player_role"] = purchase["player_role"].value
+            player["batting_style"] = purchase["batting_style"].value if purchase["batting_style"] else None
+            player["bowling_style"] = purchase["bowling_style"].value if purchase["bowling_style"] else None
+            player["purchase_price"] = float(purchase["purchase_price"])
+            players_list.append(player)
         
         return TeamDetails(
             team_id=team_season.team_id,
@@ -108,34 +142,37 @@ class TrackingService:
         )
 
     @staticmethod
-    def get_auction_players_list(season_id: int, current_user: User, db: Session) -> List[AuctionPlayersList]:
+    def get_auction_players_list(season_id: int, current_user: User, db: Session) -> Iterable[RowMapping]:
         """
         Get list of all players selected for auction with their IDs (for organizer reference).
+        Ownership is checked immediately; rows stream from a server-side cursor in batches.
         """
         # Verify season belongs to organizer
-        ValidationManager.validate_season_ownership(db, season_id, current_user)
-        
-        # Get all players selected for auction
-        player_seasons = db.query(PlayerSeasonModel).filter(
-            PlayerSeasonModel.season_id == season_id,
-            PlayerSeasonModel.is_selected_for_auction == True,
-            PlayerSeasonModel.is_active == True
-        ).all()
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
+        return db.execute(_AUCTION_PLAYERS, {"season_id": season_id}).mappings()
+
+    @staticmethod
+    def get_season_summary(season_id: int, current_user: User, db: Session) -> SeasonSummary:
+        """
+        Get the teams overview and the auction players list together.
+        Both reads share one ownership check and one connection.
+        """
+        # Verify season belongs to organizer
+        ValidationManager.ensure_season_ownership(db, season_id, current_user)
         
-        players_list = []
-        for ps in player_seasons:
-            player = ps.player
-            players_list.append(AuctionPlayersList(
-                player_id=player.id,
-                first_name=player.first_name,
-                last_name=player.last_name,
-                village=player.village,
-                mobile=player.mobile,
-                player_role=player.player_role.value,
-                batting_style=player.batting_style.value if player.batting_style else None,
-                bowling_style=player.bowling_style.value if player.bowling_style else None,
-                auction_status=ps.auction_status,
-                auction_round=ps.auction_round
-            ))
+        # Values come straight from typed columns, so skip field validation
+        teams = [
+            TeamOverview.model_construct(**row)
+            for row in db.execute(_TEAMS_OVERVIEW, {"season_id": season_id}).mappings()
+        ]
+        players = [
+            AuctionPlayersList.model_construct(**{
+                **row,
+                "player_role": row["player_role"].value,
+                "batting_style": row["batting_style"].value if row["batting_style"] else None,
+                "bowling_style": row["bowling_style"].value if row["bowling_style"] else None
+            })
+            for row in db.execute(_AUCTION_PLAYERS, {"season_id": season_id}).mappings()
+        ]
         
-        return players_list
+        return SeasonSummary.model_construct(teams=teams, players=players)
@@ -5,7 +5,11 @@ This package contains utility functions and helpers used across the application.
 """
 
 from .serializers import PlayerSerializer
+from .cache import TTLCache
+from .etag import ETagMiddleware
 
 __all__ = [
-    "PlayerSerializer"
+    "PlayerSerializer",
+    "TTLCache",
+    "ETagMiddleware"
 ]
@@ -1,5 +1,6 @@
 # app/utils/email_helper.py
 
+import logging
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
 from app.core.config import settings
 
@@ -15,6 +16,18 @@ conf = ConnectionConfig(
     VALIDATE_CERTS=True
 )
 
+# One client for the whole process; building it per message is wasted work
+fm = FastMail(conf)
+logger = logging.getLogger(__name__)
+
+
+async def _send(message: MessageSchema):
+    """Sends a message, logging SMTP failures instead of raising them after the response."""
+    try:
+        await fm.send_message(message)
+    except Exception:
+        logger.exception("Failed to send email to %s", message.recipients)
+
 # --- MODIFIED Function ---
 async def send_verification_email(email: str, token: str):
     
@@ -35,8 +48,7 @@ async def send_verification_email(email: str, token: str):
         subtype="html"
     )
     
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    await _send(message)
 
 
 async def send_password_reset_email(email: str, token: str):
@@ -64,5 +76,4 @@ async def send_password_reset_email(email: str, token: str):
         subtype="html"
     )
     
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    await _send(message)
\ No newline at end of file
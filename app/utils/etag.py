@@ -0,0 +1,62 @@
+"""
+ETag middleware for Cricket Auction API.
+
+Tags successful GET responses with a hash of their body and answers
+matching If-None-Match requests with 304 Not Modified.
+"""
+
+import hashlib
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    """Adds content-hash ETags to buffered GET responses and short-circuits unchanged polls."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        response_start: Message = {}
+        body_parts = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal response_start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                # Only tag complete 200 bodies; streamed responses go out untouched
+                if message["status"] != 200 or "content-length" not in headers or "etag" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                response_start = message
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(scope=response_start)
+            headers["ETag"] = etag
+
+            if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+                response_start["status"] = 304
+                del headers["content-length"]
+                body = b""
+
+            await send(response_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
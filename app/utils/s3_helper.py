@@ -4,9 +4,9 @@ S3 helper utilities for Cricket Auction API.
 Handles S3 operations including presigned URL generation and file management.
 """
 
-import boto3
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import cached_property
 from typing import Optional
 from botocore.exceptions import ClientError
 from fastapi import HTTPException
@@ -17,14 +17,19 @@ class S3Helper:
     """Helper class for S3 operations."""
     
     def __init__(self):
-        """Initialize S3 client with AWS credentials."""
-        self.s3_client = boto3.client(
+        """Initialize the helper; the S3 client is created on first use."""
+        self.bucket_name = settings.S3_BUCKET_NAME
+
+    @cached_property
+    def s3_client(self):
+        """S3 client with AWS credentials, built lazily to keep boto3 out of app startup."""
+        import boto3
+        return boto3.client(
             's3',
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION
         )
-        self.bucket_name = settings.S3_BUCKET_NAME
     
     def generate_presigned_upload_url(self, file_type: str = "image", 
                                     content_type: str = "image/jpeg",
@@ -2,8 +2,20 @@
 Data serializers for consistent API responses.
 """
 
+from operator import attrgetter
+from typing import Type, TypeVar
+from pydantic import BaseModel
 from app.models.player import Player as PlayerModel
 
+DTO = TypeVar("DTO", bound=BaseModel)
+
+# Response fields in output order, read from the player in one C-level call
+_PLAYER_FIELDS = (
+    "id", "first_name", "last_name", "village", "mobile",
+    "player_role", "batting_style", "bowling_style", "photo_url"
+)
+_get_player_fields = attrgetter(*_PLAYER_FIELDS)
+
 
 class PlayerSerializer:
     """Serializer for player data."""
@@ -13,14 +25,21 @@ class PlayerSerializer:
         """
         Serialize player data into a consistent dictionary format.
         """
-        return {
-            "id": player.id,
-            "first_name": player.first_name,
-            "last_name": player.last_name,
-            "village": player.village,
-            "mobile": player.mobile,
-            "player_role": player.player_role.value,
-            "batting_style": player.batting_style.value if player.batting_style else None,
-            "bowling_style": player.bowling_style.value if player.bowling_style else None,
-            "photo_url": player.photo_url
-        }
+        data = dict(zip(_PLAYER_FIELDS, _get_player_fields(player)))
+        # Enum columns go out as their values
+        data["player_role"] = data["player_role"].value
+        if data["batting_style"]:
+            data["batting_style"] = data["batting_style"].value
+        if data["bowling_style"]:
+            data["bowling_style"] = data["bowling_style"].value
+        return data
+
+
+def construct_from_orm(dto_cls: Type[DTO], obj) -> DTO:
+    """
+    Build a flat response DTO from a trusted ORM row without running validation.
+    Fields the row doesn't have keep their DTO defaults.
+    """
+    return dto_cls.model_construct(**{
+        name: getattr(obj, name) for name in dto_cls.model_fields if hasattr(obj, name)
+    })
@@ -0,0 +1,227 @@
+"""
+Shared pytest fixtures for Cricket Auction API.
+
+Runs the app against a throwaway SQLite database with the development-only
+guards switched on, so unplanned lazy loads raise instead of quietly adding
+queries.
+"""
+
+import itertools
+import os
+import tempfile
+from contextlib import contextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+
+# Settings are read at import time, so configure them before importing the app
+_DB_DIR = tempfile.mkdtemp(prefix="cricket-auction-tests-")
+os.environ["ENVIRONMENT"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("MAIL_USERNAME", "tests")
+os.environ.setdefault("MAIL_PASSWORD", "tests")
+os.environ.setdefault("MAIL_FROM", "tests@example.com")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.core import security
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.enums import Role, AuctionStatus, TournamentCategory
+from app.models import User, Tournament, Season, Player, PlayerSeason, Team, TeamSeason, PlayerPurchase
+
+
+# Keeps emails and mobiles unique across the factory-made users of a run
+_unique = itertools.count(1)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema once for the whole run."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db():
+    """A session for arranging data directly."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def season_data(database):
+    """
+    An organizer's season mid-auction: four selected players, two teams and
+    one completed purchase.
+    """
+    db = SessionLocal()
+    organizer = User(
+        first_name="Org", last_name="One", email="organizer@example.com", mobile="9000000001",
+        hashed_password="unused", role=Role.ORGANIZER, is_approved=True, is_verified=True, auction_limit=5
+    )
+    db.add(organizer)
+    db.flush()
+
+    tournament = Tournament(name="Village Cup", category=TournamentCategory.VILLAGE, created_by=organizer.id)
+    db.add(tournament)
+    db.flush()
+    season = Season(
+        name="2025", year=2025, tournament_id=tournament.id, created_by=organizer.id,
+        registration_open=False, base_price=Decimal("100"), max_players_per_team=5,
+        total_budget_per_team=Decimal("2000"), auction_configured=True, auction_started=True
+    )
+    db.add(season)
+    db.flush()
+
+    players = [
+        Player(first_name=f"Player{i}", last_name="Test", village="Village", mobile=f"98000000{i:02d}",
+               is_batsman=True, is_bowler=i % 2 == 0)
+        for i in range(4)
+    ]
+    db.add_all(players)
+    db.flush()
+    db.add_all([
+        PlayerSeason(player_id=player.id, season_id=season.id, is_selected_for_auction=True)
+        for player in players
+    ])
+
+    teams = [Team(name=f"Team {name}", owner_name=f"Owner {name}") for name in "AB"]
+    db.add_all(teams)
+    db.flush()
+    team_seasons = [
+        TeamSeason(team_id=team.id, season_id=season.id, total_budget=Decimal("2000"),
+                   remaining_budget=Decimal("2000"), max_players=5)
+        for team in teams
+    ]
+    db.add_all(team_seasons)
+    db.flush()
+
+    # Team A has bought the first player
+    sold = team_seasons[0]
+    sold.remaining_budget -= Decimal("500")
+    sold.current_players = 1
+    db.add(PlayerPurchase(team_season_id=sold.id, player_id=players[0].id, purchase_price=Decimal("500")))
+    db.query(PlayerSeason).filter(PlayerSeason.player_id == players[0].id).update(
+        {"auction_status": AuctionStatus.SOLD}
+    )
+    db.commit()
+
+    data = {
+        "season_id": season.id,
+        "team_id": teams[0].id,
+        "headers": {
+            "Authorization": "Bearer " + security.create_access_token(
+                data={"sub": organizer.email, "uid": organizer.id}
+            )
+        },
+    }
+    db.close()
+    return data
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Builds the Bearer headers a user would get from login."""
+    def headers(user: User) -> dict:
+        token = security.create_access_token(data={"sub": user.email, "uid": user.id})
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers
+
+
+@pytest.fixture
+def make_user(db):
+    """Factory for verified, approved users; defaults to an organizer."""
+    def factory(**fields) -> User:
+        n = next(_unique)
+        values = dict(
+            first_name="Test", last_name=f"User{n}", email=f"user{n}@example.com", mobile=f"97{n:08d}",
+            hashed_password="unused", role=Role.ORGANIZER, is_approved=True, is_verified=True
+        )
+        values.update(fields)
+        user = User(**values)
+        db.add(user)
+        db.commit()
+        return user
+
+    return factory
+
+
+@pytest.fixture
+def make_season(db):
+    """
+    Factory for an organizer's configured season with pending, selected
+    players and fresh teams. The auction has started unless told otherwise.
+    """
+    def factory(organizer: User, *, players: int = 0, teams: int = 0, **fields) -> SimpleNamespace:
+        n = next(_unique)
+        tournament = Tournament(name=f"Cup {n}", category=TournamentCategory.VILLAGE, created_by=organizer.id)
+        db.add(tournament)
+        db.flush()
+        values = dict(
+            name=str(n), year=2025, tournament_id=tournament.id, created_by=organizer.id,
+            registration_open=False, base_price=Decimal("100"), max_players_per_team=5,
+            total_budget_per_team=Decimal("2000"), auction_configured=True, auction_started=True
+        )
+        values.update(fields)
+        season = Season(**values)
+        db.add(season)
+        db.flush()
+
+        season_players = [
+            Player(first_name=f"Player{n}x{i}", last_name="Test", village="Village",
+                   mobile=f"96{n:05d}{i:03d}", is_batsman=True)
+            for i in range(players)
+        ]
+        db.add_all(season_players)
+        db.flush()
+        db.add_all([
+            PlayerSeason(player_id=player.id, season_id=season.id, is_selected_for_auction=True)
+            for player in season_players
+        ])
+
+        season_teams = [Team(name=f"Team {n}-{i}", owner_name=f"Owner {i}") for i in range(teams)]
+        db.add_all(season_teams)
+        db.flush()
+        team_seasons = [
+            TeamSeason(team_id=team.id, season_id=season.id, total_budget=season.total_budget_per_team,
+                       remaining_budget=season.total_budget_per_team, max_players=season.max_players_per_team)
+            for team in season_teams
+        ]
+        db.add_all(team_seasons)
+        db.commit()
+        return SimpleNamespace(season=season, players=season_players, team_seasons=team_seasons)
+
+    return factory
+
+
+@pytest.fixture
+def count_queries():
+    """Context manager that collects every SQL statement sent while it is open."""
+    @contextmanager
+    def counter():
+        queries = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -0,0 +1,153 @@
+"""
+Behaviour of the live-auction endpoints.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.enums import AuctionStatus
+from app.managers import DataManager
+from app.models import PlayerPurchase, PlayerSeason, TeamSeason
+
+
+def test_next_player_asks_to_start_next_round_when_only_unsold_remain(client, db, make_user, make_season, auth_headers):
+    organizer = make_user()
+    seeded = make_season(organizer, players=2)
+    db.query(PlayerSeason).filter(PlayerSeason.season_id == seeded.season.id).update(
+        {"auction_status": AuctionStatus.UNSOLD}
+    )
+    db.commit()
+
+    response = client.get(
+        f"/api/organizer/seasons/{seeded.season.id}/next-player", headers=auth_headers(organizer)
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "message": "No pending players. Start next round with unsold players?",
+        "action_required": "start_next_round",
+    }
+
+
+def test_next_player_reports_completion_when_no_players_remain(client, make_user, make_season, auth_headers):
+    organizer = make_user()
+    seeded = make_season(organizer)
+
+    response = client.get(
+        f"/api/organizer/seasons/{seeded.season.id}/next-player", headers=auth_headers(organizer)
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["action_required"] == "auction_complete"
+
+
+def test_bid_records_the_sale_and_charges_the_team(client, db, make_user, make_season, auth_headers):
+    organizer = make_user()
+    seeded = make_season(organizer, players=1, teams=1)
+    player, team_season = seeded.players[0], seeded.team_seasons[0]
+
+    response = client.post(
+        f"/api/organizer/seasons/{seeded.season.id}/bid-player",
+        json={"player_id": player.id, "team_id": team_season.team_id, "bid_amount": "300"},
+        headers=auth_headers(organizer),
+    )
+
+    assert response.status_code == 200, response.text
+    db.expire_all()
+    team_season = db.get(TeamSeason, team_season.id)
+    assert (team_season.remaining_budget, team_season.current_players) == (Decimal("1700"), 1)
+    purchase = db.query(PlayerPurchase).filter(PlayerPurchase.team_season_id == team_season.id).one()
+    assert (purchase.player_id, purchase.purchase_price) == (player.id, Decimal("300"))
+
+
+def test_player_sale_statement_compiles_for_postgresql():
+    # The single-statement sale only runs on PostgreSQL, which the suite doesn't have
+    compiled = DataManager.player_sale_statement(3, 7, Decimal("250")).compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+
+    assert sql.startswith("WITH purchase AS (INSERT INTO player_purchases ")
+    assert "RETURNING player_purchases.team_season_id, player_purchases.purchase_price)" in sql
+    assert (
+        "UPDATE team_seasons SET remaining_budget=(team_seasons.remaining_budget - purchase.purchase_price), "
+        "current_players=(team_seasons.current_players + %(current_players_1)s) FROM purchase "
+        "WHERE team_seasons.id = purchase.team_season_id "
+        "RETURNING team_seasons.remaining_budget, team_seasons.current_players"
+    ) in sql
+    assert {3, 7, Decimal("250"), False} <= set(compiled.params.values())
+
+
+def test_fast_assign_checks_budgets_against_the_running_totals(client, db, make_user, make_season, auth_headers, count_queries):
+    organizer = make_user()
+    seeded = make_season(organizer, players=3, teams=2)
+    first, second, third = (player.id for player in seeded.players)
+    team_a, team_b = seeded.team_seasons
+    assignments = [
+        {"player_id": first, "team_id": team_a.team_id, "price": "1500"},
+        # Affordable against the starting budget, but not once the first sale is charged
+        {"player_id": second, "team_id": team_a.team_id, "price": "400"},
+        {"player_id": second, "team_id": team_a.team_id, "price": "200"},
+        # Already sold earlier in this batch
+        {"player_id": first, "team_id": team_b.team_id, "price": "100"},
+        {"player_id": third, "team_id": team_b.team_id, "price": "250"},
+    ]
+
+    with count_queries() as queries:
+        response = client.post(
+            f"/api/organizer/seasons/{seeded.season.id}/fast-assign",
+            json=assignments,
+            headers=auth_headers(organizer),
+        )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["assigned_count"] == 3
+    assert sum("INSERT INTO player_purchases" in query for query in queries) == 1
+
+    db.expire_all()
+    assert [
+        (team_season.remaining_budget, team_season.current_players)
+        for team_season in (db.get(TeamSeason, team_a.id), db.get(TeamSeason, team_b.id))
+    ] == [(Decimal("300"), 2), (Decimal("1750"), 1)]
+    purchases = db.query(PlayerPurchase).filter(
+        PlayerPurchase.team_season_id.in_([team_a.id, team_b.id])
+    ).order_by(PlayerPurchase.player_id)
+    assert [(purchase.player_id, purchase.team_season_id, purchase.purchase_price) for purchase in purchases] == [
+        (first, team_a.id, Decimal("1500")), (second, team_a.id, Decimal("200")), (third, team_b.id, Decimal("250"))
+    ]
+    statuses = db.query(PlayerSeason.auction_status).filter(PlayerSeason.season_id == seeded.season.id)
+    assert {status for status, in statuses} == {AuctionStatus.SOLD}
+
+
+def test_season_summary_matches_the_separate_endpoints(client, make_user, make_season, auth_headers):
+    organizer = make_user()
+    seeded = make_season(organizer, players=2, teams=2)
+    headers = auth_headers(organizer)
+    base = f"/api/organizer/seasons/{seeded.season.id}"
+    sold, team_season = seeded.players[0], seeded.team_seasons[0]
+    client.post(
+        f"{base}/bid-player",
+        json={"player_id": sold.id, "team_id": team_season.team_id, "bid_amount": "300"},
+        headers=headers,
+    ).raise_for_status()
+
+    response = client.get(f"{base}/summary", headers=headers)
+
+    assert response.status_code == 200, response.text
+    summary = response.json()
+    assert summary["teams"] == client.get(f"{base}/teams-overview", headers=headers).json()
+    assert summary["players"] == client.get(f"{base}/auction-players", headers=headers).json()
+    team = next(team for team in summary["teams"] if team["team_id"] == team_season.team_id)
+    assert (Decimal(team["remaining_budget"]), Decimal(team["total_budget"]), team["current_players"]) == (
+        Decimal("1700"), Decimal("2000"), 1
+    )
+    assert {player["player_id"]: player["auction_status"] for player in summary["players"]} == {
+        sold.id: AuctionStatus.SOLD.value, seeded.players[1].id: AuctionStatus.PENDING.value
+    }
+
+
+def test_season_summary_is_only_served_to_the_owner(client, make_user, make_season, auth_headers):
+    seeded = make_season(make_user(), players=1, teams=1)
+
+    response = client.get(f"/api/organizer/seasons/{seeded.season.id}/summary", headers=auth_headers(make_user()))
+
+    assert response.status_code == 404, response.text
@@ -0,0 +1,64 @@
+"""
+Query-count and lazy-load guards for the season list and tracking endpoints.
+"""
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy.exc import InvalidRequestError
+
+from app.db.loading import strict_loading
+from app.dto import team_dto
+from app.models import PlayerPurchase, TeamSeason
+
+MAX_QUERIES = 3
+
+LIST_ENDPOINTS = [
+    "/api/organizer/seasons/{season_id}/players",
+    "/api/organizer/seasons/{season_id}/teams",
+    "/api/organizer/seasons/{season_id}/teams-overview",
+    "/api/organizer/seasons/{season_id}/auction-players",
+]
+
+
+def test_strict_loading_is_enabled_outside_production():
+    assert strict_loading(), "raiseload('*') guard should be on in tests"
+
+
+def test_strict_loading_raises_on_unplanned_lazy_load(db, season_data):
+    team_season = db.query(TeamSeason).options(*strict_loading()).filter(
+        TeamSeason.season_id == season_data["season_id"]
+    ).first()
+    with pytest.raises(InvalidRequestError):
+        team_season.team
+
+    purchase = db.query(PlayerPurchase).options(*strict_loading()).first()
+    with pytest.raises(InvalidRequestError):
+        purchase.player
+
+
+@pytest.mark.parametrize("path", LIST_ENDPOINTS)
+def test_list_endpoint_query_count(client, season_data, count_queries, path):
+    with count_queries() as queries:
+        response = client.get(path.format(**season_data), headers=season_data["headers"])
+
+    assert response.status_code == 200, response.text
+    assert response.json(), "seeded season should list rows"
+    assert len(queries) <= MAX_QUERIES, queries
+
+def test_season_teams_match_response_model(client, season_data):
+    # The listing bypasses response validation, so check its rows against the schema
+    path = "/api/organizer/seasons/{season_id}/teams".format(**season_data)
+    response = client.get(path, headers=season_data["headers"])
+
+    assert response.status_code == 200, response.text
+    TypeAdapter(list[team_dto.TeamSeason]).validate_python(response.json())
+
+def test_team_details_query_count(client, season_data, count_queries):
+    path = "/api/organizer/seasons/{season_id}/teams/{team_id}/details".format(**season_data)
+    with count_queries() as queries:
+        response = client.get(path, headers=season_data["headers"])
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [player["first_name"] for player in body["players"]] == ["Player0"]
+    assert len(queries) <= MAX_QUERIES, queries
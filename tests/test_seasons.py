@@ -0,0 +1,76 @@
+"""
+Season-scoped endpoints: configuration, ownership and season creation.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.managers import ValidationManager
+from app.models import Season
+
+
+def test_cached_auction_config_is_only_served_to_the_owner(client, make_user, make_season, auth_headers):
+    owner = make_user()
+    seeded = make_season(owner)
+    path = f"/api/organizer/seasons/{seeded.season.id}/auction-config"
+
+    # The first read caches the started season's config
+    assert client.get(path, headers=auth_headers(owner)).json()["auction_started"] is True
+    response = client.get(path, headers=auth_headers(make_user()))
+
+    assert response.status_code == 404, response.text
+
+
+def test_season_ownership_is_not_cached_for_inactive_seasons(db, make_user, make_season, count_queries):
+    organizer = make_user()
+    seeded = make_season(organizer, is_active=False)
+
+    for _ in range(2):
+        # Drop the seeded row from the identity map so the check has to query
+        db.expunge_all()
+        with count_queries() as queries:
+            ValidationManager.ensure_season_ownership(db, seeded.season.id, organizer)
+        assert queries, "an inactive season's ownership should be checked every time"
+
+
+def test_season_ownership_cache_is_per_owner(db, make_user, make_season):
+    owner = make_user()
+    seeded = make_season(owner)
+    ValidationManager.ensure_season_ownership(db, seeded.season.id, owner)
+
+    with pytest.raises(HTTPException) as error:
+        ValidationManager.ensure_season_ownership(db, seeded.season.id, make_user())
+    assert error.value.status_code == 404
+
+
+def test_creating_a_season_spends_a_credit(client, db, make_user, make_season, auth_headers):
+    organizer = make_user(auction_limit=2, auctions_created=1)
+    tournament_id = make_season(organizer).season.tournament_id
+
+    response = client.post(
+        f"/api/organizer/tournaments/{tournament_id}/seasons",
+        json={"name": "2026", "year": 2026},
+        headers=auth_headers(organizer),
+    )
+
+    assert response.status_code == 200, response.text
+    db.expire_all()
+    assert organizer.auctions_created == 2
+    assert db.query(Season).filter(Season.tournament_id == tournament_id).count() == 2
+
+
+def test_creating_a_season_without_credits_creates_nothing(client, db, make_user, make_season, auth_headers):
+    organizer = make_user(auction_limit=1, auctions_created=1)
+    tournament_id = make_season(organizer).season.tournament_id
+
+    response = client.post(
+        f"/api/organizer/tournaments/{tournament_id}/seasons",
+        json={"name": "2026", "year": 2026},
+        headers=auth_headers(organizer),
+    )
+
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Insufficient credits. You have used 1 out of 1 credits."
+    db.expire_all()
+    assert organizer.auctions_created == 1
+    assert db.query(Season).filter(Season.tournament_id == tournament_id).count() == 1
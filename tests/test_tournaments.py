@@ -0,0 +1,17 @@
+"""
+Tournament creation and listing.
+"""
+
+
+def test_created_tournament_matches_its_listing(client, make_user, auth_headers):
+    organizer = make_user()
+    headers = auth_headers(organizer)
+
+    created = client.post(
+        "/api/organizer/tournaments", json={"name": "Harvest Cup", "category": "VILLAGE"}, headers=headers
+    )
+    listed = client.get("/api/organizer/tournaments", headers=headers)
+
+    assert created.status_code == 200, created.text
+    assert created.json()["category"] == "Village"
+    assert listed.json() == [created.json()]
@@ -0,0 +1,113 @@
+"""
+Profile endpoints and the superadmin user management endpoints.
+"""
+
+import pytest
+from sqlalchemy import func
+
+from app.api import deps
+from app.enums import Role
+from app.models import User
+
+
+@pytest.mark.parametrize("path", ["/api/organizer/dashboard", "/api/organizer/profile", "/api/user/me"])
+def test_profile_reflects_changes_made_by_another_worker(client, db, make_user, auth_headers, path):
+    organizer = make_user(auction_limit=1)
+    headers = auth_headers(organizer)
+    assert client.get(path, headers=headers).json()["auction_limit"] == 1
+
+    # Written straight to the database, so no cache in this process is invalidated
+    organizer.auction_limit = 4
+    db.commit()
+
+    assert client.get(path, headers=headers).json()["auction_limit"] == 4
+
+
+def test_organizer_list_reflects_changes_made_by_another_worker(client, db, make_user, auth_headers):
+    headers = auth_headers(make_user(role=Role.SUPERADMIN))
+    organizer = make_user()
+
+    def listed_ids():
+        response = client.get("/api/superadmin/organizers", headers=headers)
+        assert response.status_code == 200, response.text
+        return {user["id"] for user in response.json()}
+
+    assert organizer.id in listed_ids()
+
+    # Written straight to the database, so no cache in this process is invalidated
+    organizer.role = Role.USER
+    db.commit()
+
+    assert organizer.id not in listed_ids()
+
+
+@pytest.mark.parametrize("change", [{"action": "reject"}, {"new_limit": 0}, {"new_role": "ORGANIZER"}])
+def test_bulk_update_rejects_changes_to_own_account(client, db, make_user, auth_headers, change):
+    superadmin = make_user(role=Role.SUPERADMIN)
+    organizer = make_user(auction_limit=3)
+
+    response = client.post(
+        "/api/superadmin/users/bulk-update",
+        json=[{"user_id": organizer.id, "new_limit": 7}, {"user_id": superadmin.id, **change}],
+        headers=auth_headers(superadmin),
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cannot change your own account"
+    db.expire_all()
+    assert (superadmin.is_approved, superadmin.role, organizer.auction_limit) == (True, Role.SUPERADMIN, 3)
+
+
+def test_bulk_update_applies_changes_to_other_users(client, db, make_user, auth_headers):
+    superadmin = make_user(role=Role.SUPERADMIN)
+    organizer = make_user(auction_limit=3)
+
+    response = client.post(
+        "/api/superadmin/users/bulk-update",
+        json=[{"user_id": organizer.id, "new_limit": 7, "action": "reject"}],
+        headers=auth_headers(superadmin),
+    )
+
+    assert response.status_code == 200, response.text
+    assert [(user["id"], user["auction_limit"], user["is_approved"]) for user in response.json()] == [
+        (organizer.id, 7, False)
+    ]
+
+
+def test_bulk_approve_updates_users_and_drops_their_cached_views(client, db, make_user, auth_headers):
+    superadmin = make_user(role=Role.SUPERADMIN)
+    pending = [make_user(is_approved=False), make_user(is_approved=False)]
+    for user in pending:
+        deps._user_snapshot_cache.set(user.id, {"is_approved": False})
+        deps.user_profile_cache.set(user.id, ((), b"{}"))
+
+    response = client.post(
+        "/api/superadmin/users/bulk-approve",
+        json={"user_ids": [user.id for user in pending] + [pending[0].id], "action": "approve"},
+        headers=auth_headers(superadmin),
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == {"message": "Updated 2 users", "updated_count": 2}
+    db.expire_all()
+    for user in pending:
+        assert user.is_approved is True
+        assert deps._user_snapshot_cache.get(user.id) is None
+        assert deps.user_profile_cache.get(user.id) is None
+
+
+def test_bulk_approve_reports_missing_users_without_changing_any(client, db, make_user, auth_headers):
+    superadmin = make_user(role=Role.SUPERADMIN)
+    pending = make_user(is_approved=False)
+    missing_id = db.query(func.max(User.id)).scalar() + 1
+
+    response = client.post(
+        "/api/superadmin/users/bulk-approve",
+        json={"user_ids": [pending.id, missing_id], "action": "approve"},
+        headers=auth_headers(superadmin),
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Users not found: {missing_id}"
+    db.expire_all()
+    assert pending.is_approved is False